@@ -0,0 +1,85 @@
+"""integer cents
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 16:06:02.643053
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+from app.core.config import settings
+from app.core.money import minor_units
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def cents_sql(column: str, scale: int) -> str:
+    """Conversion SQL alignée sur to_cents : arrondi au demi supérieur sur tous les moteurs"""
+    # ROUND sur double precision arrondit au pair sous PostgreSQL : passage par NUMERIC.
+    # L'arrondi intermédiaire à 6 décimales efface le bruit binaire du flottant
+    # (1.005 * 100 = 100.4999...), comme to_cents qui part de str(amount)
+    return f'CAST(ROUND(ROUND(CAST({column} AS NUMERIC) * {scale}, 6)) AS BIGINT)'
+
+
+def upgrade() -> None:
+    # Colonnes ajoutées nullables, remplies à partir des montants flottants,
+    # puis rendues obligatoires avant la suppression des anciennes colonnes
+    with op.batch_alter_table('budget', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('limit_cents', sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column('spent_cents', sa.BigInteger(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('currency', sqlmodel.sql.sqltypes.AutoString(length=3), server_default=settings.DEFAULT_CURRENCY, nullable=False))
+
+    with op.batch_alter_table('transaction', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('amount_cents', sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column('currency', sqlmodel.sql.sqltypes.AutoString(length=3), server_default=settings.DEFAULT_CURRENCY, nullable=False))
+
+    # Montants existants exprimés dans la devise de l'installation
+    scale = 10 ** minor_units(settings.DEFAULT_CURRENCY)
+    op.execute(
+        f'UPDATE budget SET limit_cents = {cents_sql("limit_amount", scale)}, '
+        f'spent_cents = {cents_sql("current_spent", scale)}'
+    )
+    op.execute(f'UPDATE "transaction" SET amount_cents = {cents_sql("amount", scale)}')
+
+    with op.batch_alter_table('budget', schema=None) as batch_op:
+        batch_op.alter_column('limit_cents', existing_type=sa.BigInteger(), nullable=False)
+        batch_op.drop_column('limit_amount')
+        batch_op.drop_column('current_spent')
+
+    with op.batch_alter_table('transaction', schema=None) as batch_op:
+        batch_op.alter_column('amount_cents', existing_type=sa.BigInteger(), nullable=False)
+        batch_op.drop_column('amount')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('transaction', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('amount', sa.FLOAT(), nullable=True))
+
+    with op.batch_alter_table('budget', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('current_spent', sa.FLOAT(), nullable=True))
+        batch_op.add_column(sa.Column('limit_amount', sa.FLOAT(), nullable=True))
+
+    scale = 10 ** minor_units(settings.DEFAULT_CURRENCY)
+    op.execute(f'UPDATE "transaction" SET amount = amount_cents / {scale}.0')
+    op.execute(f'UPDATE budget SET limit_amount = limit_cents / {scale}.0, current_spent = spent_cents / {scale}.0')
+
+    with op.batch_alter_table('transaction', schema=None) as batch_op:
+        batch_op.alter_column('amount', existing_type=sa.FLOAT(), nullable=False)
+        batch_op.drop_column('currency')
+        batch_op.drop_column('amount_cents')
+
+    with op.batch_alter_table('budget', schema=None) as batch_op:
+        batch_op.alter_column('current_spent', existing_type=sa.FLOAT(), nullable=False)
+        batch_op.alter_column('limit_amount', existing_type=sa.FLOAT(), nullable=False)
+        batch_op.drop_column('currency')
+        batch_op.drop_column('spent_cents')
+        batch_op.drop_column('limit_cents')
@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable
+
+class ResultCache:
+    """Cache LRU en mémoire de résultats calculés, invalidé par étiquette (ex: user_id).
+
+    Chaque étiquette porte un numéro de génération incrémenté à chaque écriture :
+    un résultat calculé pendant une écriture concurrente n'est pas mis en cache.
+    Le cache est propre au processus (un par worker uvicorn) : les clés incluent
+    la version des données lue en base (User.data_version), si bien qu'une
+    écriture faite par un autre worker n'est jamais masquée ; l'invalidation
+    locale ne fait que libérer la mémoire plus tôt.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._entry_tags: Dict[Hashable, tuple] = {}
+        self._keys_by_tag: Dict[str, set] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, tags: Iterable[str], compute: Callable[[], Any]) -> Any:
+        """Retourner la valeur en cache ou la calculer et la mémoriser"""
+        tags = tuple(tags)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            generations = [self._generations.get(tag, 0) for tag in tags]
+
+        value = compute()
+
+        with self._lock:
+            if generations == [self._generations.get(tag, 0) for tag in tags]:
+                self._store(key, value, tags)
+        return value
+
+    def invalidate(self, tag: str):
+        """Supprimer toutes les entrées associées à une étiquette"""
+        with self._lock:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            for key in self._keys_by_tag.pop(tag, ()):
+                self._remove(key)
+
+    def clear(self):
+        """Vider le cache"""
+        with self._lock:
+            self._entries.clear()
+            self._entry_tags.clear()
+            self._keys_by_tag.clear()
+
+    def _store(self, key: Hashable, value: Any, tags: tuple):
+        self._remove(key)
+        self._entries[key] = value
+        self._entry_tags[key] = tags
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable):
+        self._entries.pop(key, None)
+        for tag in self._entry_tags.pop(key, ()):
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+# Cache partagé par les endpoints du tableau de bord
+result_cache = ResultCache()
@@ -1,14 +1,110 @@
+import logging
+import threading
+import time
+from fastapi import HTTPException, status
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
 from sqlmodel import SQLModel, create_engine, Session
 from app.core.config import settings
+from app.core.rate_limit import PoolWaitMonitor, retry_after_header
+from app.core.sqlite import SQLiteWriteQueue, configure_sqlite, is_sqlite_url, sqlite_database_path
 
-# Création du moteur de base de données
-engine = create_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+logger = logging.getLogger(__name__)
+
+# Moteur de base de données, créé au démarrage (lifespan) ou au premier usage
+engine = None
+_engine_lock = threading.Lock()
+
+# Temps d'attente récent pour obtenir une connexion (utilisé pour le délestage)
+pool_monitor = PoolWaitMonitor()
+
+def get_engine():
+    """Obtenir le moteur de base de données (création différée)"""
+    global engine
+    if engine is None:
+        # Premier usage possiblement concurrent (threads du threadpool hors lifespan)
+        with _engine_lock:
+            if engine is None:
+                if is_sqlite_url(settings.DATABASE_URL):
+                    engine = create_sqlite_engine(settings.DATABASE_URL)
+                else:
+                    engine = create_engine(
+                        settings.DATABASE_URL,
+                        echo=settings.DEBUG,
+                        pool_pre_ping=True,
+                        pool_size=settings.DB_POOL_SIZE,
+                        max_overflow=settings.DB_MAX_OVERFLOW
+                    )
+    return engine
+
+def create_sqlite_engine(url: str):
+    """Moteur du mode embarqué : WAL, PRAGMA réglés et file d'écriture unique"""
+    path = sqlite_database_path(url)
+    pool_options = {}
+    if path is not None:
+        # Un lecteur par connexion : le pool borne le nombre de lectures simultanées
+        pool_options = {"pool_size": settings.DB_POOL_SIZE, "max_overflow": settings.DB_MAX_OVERFLOW}
+    sqlite_engine = create_engine(
+        url,
+        echo=settings.DEBUG,
+        connect_args={"check_same_thread": False, "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000},
+        **pool_options
+    )
+    write_queue = None
+    if settings.SQLITE_WRITE_QUEUE:
+        write_queue = SQLiteWriteQueue(
+            f"{path}-writer.lock" if path else None,
+            settings.SQLITE_WRITE_QUEUE_TIMEOUT_MS / 1000
+        )
+    return configure_sqlite(
+        sqlite_engine,
+        journal_mode=settings.SQLITE_JOURNAL_MODE,
+        synchronous=settings.SQLITE_SYNCHRONOUS,
+        mmap_size=settings.SQLITE_MMAP_SIZE,
+        cache_size_kb=settings.SQLITE_CACHE_SIZE_KB,
+        busy_timeout_ms=settings.SQLITE_BUSY_TIMEOUT_MS,
+        write_queue=write_queue
+    )
+
+def init_engine(warm_connections: int = 0):
+    """Créer le moteur et pré-ouvrir des connexions pour absorber les premières requêtes"""
+    db_engine = get_engine()
+    connections = []
+    try:
+        for _ in range(min(warm_connections, settings.DB_POOL_SIZE)):
+            connections.append(db_engine.connect())
+    except OperationalError as exc:
+        # La base peut démarrer après l'API : les connexions seront ouvertes à la demande
+        logger.warning("Pool warm-up skipped: %s", exc)
+    finally:
+        for connection in connections:
+            connection.close()
+    return db_engine
+
+def dispose_engine():
+    """Fermer les connexions du pool"""
+    global engine
+    with _engine_lock:
+        if engine is not None:
+            engine.dispose()
+            engine = None
 
 def create_db_and_tables():
     """Créer la base de données et les tables"""
-    SQLModel.metadata.create_all(engine)
+    SQLModel.metadata.create_all(get_engine())
 
 def get_session():
     """Obtenir une session de base de données"""
-    with Session(engine) as session:
-        yield session
\ No newline at end of file
+    with Session(get_engine()) as session:
+        # Réserver la connexion immédiatement pour mesurer l'attente du pool
+        started = time.perf_counter()
+        try:
+            session.connection()
+        except PoolTimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database busy, retry later",
+                headers=retry_after_header(settings.SHED_RETRY_AFTER_SECONDS)
+            )
+        finally:
+            pool_monitor.record(time.perf_counter() - started)
+        yield session
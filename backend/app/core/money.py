@@ -0,0 +1,61 @@
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Optional, Union
+
+from app.core.config import settings
+
+# Les montants sont stockés en unités mineures entières (BIGINT, colonnes "_cents") :
+# les agrégations SQL et les calculs restent exacts. La conversion depuis/vers
+# les montants décimaux de l'API se fait uniquement aux bords (routeurs, création).
+#
+# Une installation ne gère qu'une devise (DEFAULT_CURRENCY) : les agrégations
+# n'ont donc pas à regrouper par devise. Changer DEFAULT_CURRENCY sur une base
+# existante suppose de convertir les montants déjà enregistrés.
+
+CENTS_SUFFIX = "_cents"
+
+# Nombre de décimales des devises ISO 4217 qui n'en ont pas deux
+MINOR_UNITS = {
+    "BIF": 0, "CLP": 0, "DJF": 0, "GNF": 0, "ISK": 0, "JPY": 0, "KMF": 0, "KRW": 0,
+    "PYG": 0, "RWF": 0, "UGX": 0, "VND": 0, "VUV": 0, "XAF": 0, "XOF": 0, "XPF": 0,
+    "BHD": 3, "IQD": 3, "JOD": 3, "KWD": 3, "LYD": 3, "OMR": 3, "TND": 3,
+}
+
+# Plage d'une colonne BIGINT
+MAX_MINOR_UNITS = 2 ** 63 - 1
+
+def minor_units(currency: Optional[str] = None) -> int:
+    """Nombre de décimales de la devise (2 par défaut)"""
+    return MINOR_UNITS.get(currency or settings.DEFAULT_CURRENCY, 2)
+
+def validate_currency(currency: str) -> str:
+    """Seule la devise de l'installation est acceptée"""
+    if currency != settings.DEFAULT_CURRENCY:
+        raise ValueError(f"Unsupported currency: only {settings.DEFAULT_CURRENCY} is accepted")
+    return currency
+
+def to_cents(amount: Union[float, int, str, Decimal], currency: Optional[str] = None) -> int:
+    """Convertir un montant décimal en unités mineures (arrondi commercial)"""
+    # str() évite d'hériter de l'erreur binaire du float (ex: 0.1 + 0.2)
+    value = amount if isinstance(amount, Decimal) else Decimal(str(amount))
+    if not value.is_finite():
+        raise ValueError("Amount must be a finite number")
+    value = value.scaleb(minor_units(currency))
+    if abs(value) > MAX_MINOR_UNITS:
+        raise ValueError("Amount is out of range")
+    return int(value.quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+def from_cents(cents: int, currency: Optional[str] = None) -> float:
+    """Convertir des unités mineures en montant décimal pour l'API"""
+    return cents / 10 ** minor_units(currency)
+
+def to_api_amounts(value: Any) -> Any:
+    """Convertir récursivement les clés "<nom>_cents" en "<nom>" exprimé en unités"""
+    if isinstance(value, dict):
+        return {
+            (key[:-len(CENTS_SUFFIX)] if key.endswith(CENTS_SUFFIX) else key):
+            (from_cents(item) if key.endswith(CENTS_SUFFIX) and item is not None else to_api_amounts(item))
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [to_api_amounts(item) for item in value]
+    return value
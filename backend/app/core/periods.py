@@ -0,0 +1,50 @@
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Bornes des périodes du tableau de bord (semaine du lundi au dimanche, mois et
+# année civils). Calculs purs mis en cache : les mêmes bornes sont demandées par
+# chaque requête de la journée.
+
+PERIODS = ("weekly", "monthly", "yearly")
+PERIOD_PATTERN = "^(weekly|monthly|yearly)$"
+
+# Décalage d'une même période l'année précédente, en nombre de périodes
+PERIODS_PER_YEAR = {"weekly": 52, "monthly": 12, "yearly": 1}
+
+@lru_cache(maxsize=1024)
+def period_bounds(period: str, day: date, offset: int = 0) -> Tuple[date, date]:
+    """Premier et dernier jour de la période contenant la date, décalée de offset périodes"""
+    if period == "weekly":
+        start = day - timedelta(days=day.weekday()) + timedelta(weeks=offset)
+        return start, start + timedelta(days=6)
+    if period == "monthly":
+        index = day.year * 12 + day.month - 1 + offset
+        start = date(index // 12, index % 12 + 1, 1)
+        following = index + 1
+        return start, date(following // 12, following % 12 + 1, 1) - timedelta(days=1)
+    if period == "yearly":
+        return date(day.year + offset, 1, 1), date(day.year + offset, 12, 31)
+    raise ValueError(f"Unknown period: {period}")
+
+@lru_cache(maxsize=1024)
+def comparison_bounds(
+    period: str,
+    day: date,
+    count: int,
+    year_over_year: bool = False
+) -> Tuple[Tuple[date, date], ...]:
+    """Bornes de count périodes, la plus récente en premier : périodes consécutives,
+    ou même période des années précédentes (year_over_year)"""
+    step = PERIODS_PER_YEAR[period] if year_over_year else 1
+    return tuple(period_bounds(period, day, -index * step) for index in range(count))
+
+def resolve_period(
+    period: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> Tuple[date, date]:
+    """Dates explicites si les deux sont fournies, sinon la période courante"""
+    if start_date and end_date:
+        return start_date, end_date
+    return period_bounds(period, date.today())
@@ -0,0 +1,192 @@
+import math
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+# Limitation de débit et contrôle d'admission.
+# Ce module ne dépend que de la bibliothèque standard : les dépendances FastAPI
+# qui l'utilisent sont déclarées dans app/dependencies.py.
+
+class TokenBucketLimiter:
+    """Limiteur de débit en mémoire (token bucket) indexé par clé"""
+
+    # Au-delà de ce nombre de seaux, les seaux pleins (clients inactifs) sont purgés
+    MAX_BUCKETS = 10000
+
+    def __init__(self, rate_per_minute: int, burst: int):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(max(burst, 1))
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str) -> float:
+        """Consommer un jeton : retourne 0 si accepté, sinon le délai d'attente en secondes"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last) * self.rate)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                wait = 0.0
+            else:
+                self._buckets[key] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            if len(self._buckets) > self.MAX_BUCKETS:
+                self._prune(now)
+        return wait
+
+    def _prune(self, now: float):
+        """Supprimer les seaux redevenus pleins (équivalents à un seau absent)"""
+        refill = self.capacity / self.rate if self.rate else math.inf
+        self._buckets = {
+            key: state for key, state in self._buckets.items()
+            if now - state[1] < refill
+        }
+
+class RedisTokenBucketLimiter:
+    """Limiteur token bucket partagé entre plusieurs processus via Redis"""
+
+    _SCRIPT = """
+    local rate = tonumber(ARGV[1])
+    local capacity = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    local wait = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+    else
+        wait = (1 - tokens) / rate
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+    return tostring(wait)
+    """
+
+    def __init__(self, url: str, rate_per_minute: int, burst: int):
+        # Import différé : redis n'est requis que si le backend partagé est configuré
+        import redis
+
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(max(burst, 1))
+        self._client = redis.Redis.from_url(url, socket_timeout=0.05)
+        self._script = self._client.register_script(self._SCRIPT)
+        self._errors = redis.RedisError
+        # Repli local si Redis est indisponible
+        self._fallback = TokenBucketLimiter(rate_per_minute, burst)
+
+    def acquire(self, key: str) -> float:
+        """Consommer un jeton dans Redis (repli en mémoire en cas d'erreur)"""
+        try:
+            wait = self._script(
+                keys=[f"ratelimit:{key}"],
+                args=[self.rate, self.capacity, time.time()]
+            )
+        except self._errors:
+            return self._fallback.acquire(key)
+        return float(wait)
+
+class PoolWaitMonitor:
+    """Moyenne mobile exponentielle du temps d'attente d'une connexion du pool"""
+
+    def __init__(self, alpha: float = 0.2, half_life: float = 1.0):
+        self.alpha = alpha
+        # Sans nouvelle mesure (requêtes délestées), la moyenne décroît avec le temps
+        self.half_life = half_life
+        self._ewma = 0.0
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """Enregistrer un temps d'attente mesuré"""
+        with self._lock:
+            self._ewma = self._decayed(time.monotonic())
+            self._ewma += self.alpha * (seconds - self._ewma)
+            self._last = time.monotonic()
+
+    def _decayed(self, now: float) -> float:
+        return self._ewma * 0.5 ** ((now - self._last) / self.half_life)
+
+    @property
+    def wait_ms(self) -> float:
+        """Temps d'attente moyen récent en millisecondes"""
+        return self._decayed(time.monotonic()) * 1000
+
+class InFlightTracker:
+    """Requêtes en cours par clé, pour ne délester que les clients au-delà de leur part"""
+
+    # Pas de verrou : mis à jour depuis la boucle d'événements (voir ConcurrencyLimiter)
+
+    def __init__(self):
+        self._counts: Dict[str, int] = {}
+
+    def count(self, key: str) -> int:
+        """Requêtes en cours pour la clé"""
+        return self._counts.get(key, 0)
+
+    def fair_share(self, capacity: int) -> int:
+        """Part équitable de la capacité entre les clients actifs (au moins une requête)"""
+        return max(1, capacity // max(1, len(self._counts)))
+
+    def above_share(self, key: str, capacity: int) -> bool:
+        """Vrai si le client dépasse déjà sa part.
+
+        Une requête déjà servie reste comptée jusqu'à la sortie des dépendances,
+        après l'envoi de la réponse : le client qui enchaîne ses requêtes une à
+        une n'est donc pas refusé lorsqu'il atteint tout juste sa part.
+        """
+        return self.count(key) > self.fair_share(capacity)
+
+    def acquire(self, key: str):
+        self._counts[key] = self._counts.get(key, 0) + 1
+
+    def release(self, key: str):
+        remaining = self._counts.get(key, 0) - 1
+        if remaining > 0:
+            self._counts[key] = remaining
+        else:
+            self._counts.pop(key, None)
+
+class ConcurrencyLimiter:
+    """Nombre maximal de requêtes simultanées sur une route (sans file d'attente).
+
+    Une fois la limite atteinte, une requête identifiée par une clé passe encore si
+    son client est sous sa part équitable : seuls les clients qui monopolisent la
+    route sont refusés, le dépassement restant borné par le nombre de clients.
+    """
+
+    # Pas de verrou : les dépendances async s'exécutent toutes sur la boucle
+    # d'événements, où ces incréments ne peuvent pas être interrompus.
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._in_flight = 0
+        self._per_key = InFlightTracker()
+
+    def try_acquire(self, key: Optional[str] = None) -> bool:
+        """Réserver une place si disponible"""
+        if self._in_flight >= self.limit and (key is None or self._per_key.above_share(key, self.limit)):
+            return False
+        self._in_flight += 1
+        if key is not None:
+            self._per_key.acquire(key)
+        return True
+
+    def release(self, key: Optional[str] = None):
+        """Libérer une place"""
+        self._in_flight -= 1
+        if key is not None:
+            self._per_key.release(key)
+
+def retry_after_header(seconds: Optional[float]) -> Dict[str, str]:
+    """En-tête Retry-After (en secondes entières, au minimum 1)"""
+    return {"Retry-After": str(max(1, math.ceil(seconds or 0)))}
+
+def build_rate_limiter(redis_url: str, rate_per_minute: int, burst: int):
+    """Construire le limiteur : partagé si une URL Redis est fournie, sinon en mémoire"""
+    if redis_url:
+        return RedisTokenBucketLimiter(redis_url, rate_per_minute, burst)
+    return TokenBucketLimiter(rate_per_minute, burst)
+
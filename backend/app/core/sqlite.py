@@ -0,0 +1,155 @@
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+
+try:
+    import fcntl
+except ImportError:  # Windows : file d'écriture limitée au processus
+    fcntl = None
+
+# Mode embarqué SQLite (installations mono-locataire).
+# Journal WAL : les lecteurs ne bloquent pas l'écrivain et inversement, mais
+# SQLite n'accepte qu'une transaction d'écriture à la fois. Plutôt que de laisser
+# les écrivains concurrents se disputer le verrou (attente active puis
+# "database is locked"), les transactions d'écriture passent par une file unique.
+
+logger = logging.getLogger(__name__)
+
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+def is_sqlite_url(url: str) -> bool:
+    """Vrai si l'URL désigne une base SQLite"""
+    return make_url(url).get_backend_name() == "sqlite"
+
+def sqlite_database_path(url: str) -> Optional[str]:
+    """Chemin du fichier de base, None pour une base en mémoire"""
+    database = make_url(url).database
+    if not database or database == ":memory:" or database.startswith("file::memory:"):
+        return None
+    return database
+
+class SQLiteWriteQueue:
+    """File d'attente des transactions d'écriture : un seul écrivain à la fois.
+
+    Verrou de thread dans le processus, doublé d'un verrou de fichier (flock)
+    partagé entre les workers uvicorn quand la plateforme le permet. Le verrou
+    est pris à la première écriture d'une transaction et rendu au COMMIT/ROLLBACK.
+    """
+
+    # Attente du verrou de fichier par sondage (flock n'accepte pas de délai)
+    POLL_MIN_SECONDS = 0.001
+    POLL_MAX_SECONDS = 0.02
+
+    def __init__(self, lock_path: Optional[str], timeout: float):
+        self.lock_path = lock_path if fcntl is not None else None
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._file_locked = False
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        """Après un fork : ne pas hériter du verrou ni du descripteur du parent"""
+        self._lock = threading.Lock()
+        self._file_locked = False
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def acquire(self) -> bool:
+        """Attendre son tour ; False si le délai est dépassé (SQLite arbitre alors seul)"""
+        deadline = time.monotonic() + self.timeout
+        if not self._lock.acquire(timeout=self.timeout):
+            logger.warning("SQLite write queue timeout after %.1f s", self.timeout)
+            return False
+        if self.lock_path is not None and not self._lock_file(deadline):
+            self._lock.release()
+            logger.warning("SQLite writer lock file timeout after %.1f s", self.timeout)
+            return False
+        return True
+
+    def _lock_file(self, deadline: float) -> bool:
+        """Prendre le verrou de fichier sans bloquer au-delà de l'échéance"""
+        delay = self.POLL_MIN_SECONDS
+        while True:
+            try:
+                if self._fd is None:
+                    self._fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                self._file_locked = True
+                return True
+            except BlockingIOError:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, self.POLL_MAX_SECONDS)
+            except OSError as exc:
+                logger.warning("SQLite writer lock file unavailable: %s", exc)
+                self.lock_path = None
+                return True
+
+    def release(self):
+        """Rendre la main à l'écrivain suivant"""
+        if self._file_locked:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            self._file_locked = False
+        self._lock.release()
+
+def configure_sqlite(
+    engine: Engine,
+    journal_mode: str,
+    synchronous: str,
+    mmap_size: int,
+    cache_size_kb: int,
+    busy_timeout_ms: int,
+    write_queue: Optional[SQLiteWriteQueue] = None
+) -> Engine:
+    """Appliquer les PRAGMA à chaque connexion et brancher la file d'écriture"""
+    pragmas = [
+        f"PRAGMA journal_mode={journal_mode}",
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA mmap_size={int(mmap_size)}",
+        f"PRAGMA cache_size={-int(cache_size_kb)}",  # négatif : taille en Kio
+        f"PRAGMA busy_timeout={int(busy_timeout_ms)}",
+        "PRAGMA foreign_keys=ON",  # contraintes vérifiées comme sur PostgreSQL
+        "PRAGMA temp_store=MEMORY",
+    ]
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+    if write_queue is None:
+        return engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def queue_writes(conn, cursor, statement, parameters, context, executemany):
+        if "sqlite_writer" not in conn.info and statement.lstrip()[:7].upper().startswith(WRITE_STATEMENTS):
+            if write_queue.acquire():
+                conn.info["sqlite_writer"] = True
+
+    # Émis juste avant le COMMIT/ROLLBACK du pilote : l'écrivain suivant patiente
+    # au plus le temps de ce dernier (busy_timeout)
+    @event.listens_for(engine, "commit")
+    @event.listens_for(engine, "rollback")
+    def release_writer(conn):
+        if conn.info.pop("sqlite_writer", False):
+            write_queue.release()
+
+    # Filet de sécurité : connexion rendue au pool sans COMMIT/ROLLBACK explicite
+    @event.listens_for(engine, "checkin")
+    def release_on_checkin(dbapi_connection, connection_record):
+        if connection_record.info.pop("sqlite_writer", False):
+            write_queue.release()
+
+    return engine
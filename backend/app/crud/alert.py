@@ -0,0 +1,91 @@
+from sqlalchemy import delete, update
+from sqlmodel import Session, select, and_
+from app.models.alert import Alert, AlertCreate
+from app.models.user import User
+from datetime import datetime
+from typing import List, Optional
+
+def _adjust_unread_count(db: Session, user_id: str, delta: int):
+    """Mettre à jour le compteur dénormalisé d'alertes non lues (sans lecture préalable)"""
+    db.execute(
+        update(User)
+        .where(User.user_id == user_id)
+        .values(unread_alert_count=User.unread_alert_count + delta)
+    )
+
+def create_alert(db: Session, alert: AlertCreate, user_id: str) -> Alert:
+    """Créer une nouvelle alerte"""
+    db_alert = Alert(
+        **alert.dict(),
+        user_id=user_id
+    )
+    db.add(db_alert)
+    if not db_alert.is_read:
+        _adjust_unread_count(db, user_id, 1)
+    db.commit()
+    db.refresh(db_alert)
+    return db_alert
+
+def get_alerts(
+    db: Session,
+    user_id: str,
+    unread_only: bool = False,
+    skip: int = 0,
+    limit: int = 50
+) -> List[Alert]:
+    """Récupérer les alertes, des plus récentes aux plus anciennes"""
+    statement = select(Alert).where(Alert.user_id == user_id)
+
+    if unread_only:
+        # Correspond à l'index partiel ix_alert_user_unread
+        statement = statement.where(Alert.is_read == False)  # noqa: E712
+
+    statement = statement.order_by(Alert.created_at.desc()).offset(skip).limit(limit)
+    return db.exec(statement).all()
+
+def get_alert_by_id(db: Session, alert_id: str, user_id: str) -> Optional[Alert]:
+    """Récupérer une alerte par ID"""
+    statement = select(Alert).where(
+        and_(Alert.alert_id == alert_id, Alert.user_id == user_id)
+    )
+    return db.exec(statement).first()
+
+def mark_alert_read(db: Session, alert_id: str, user_id: str) -> Optional[Alert]:
+    """Marquer une alerte comme lue (le compteur n'est décrémenté qu'au premier passage)"""
+    result = db.execute(
+        update(Alert)
+        .where(and_(Alert.alert_id == alert_id, Alert.user_id == user_id, Alert.is_read == False))  # noqa: E712
+        .values(is_read=True)
+    )
+    if result.rowcount:
+        _adjust_unread_count(db, user_id, -result.rowcount)
+    db.commit()
+    return get_alert_by_id(db, alert_id, user_id)
+
+def mark_all_alerts_read(db: Session, user_id: str) -> int:
+    """Marquer toutes les alertes comme lues en un seul UPDATE ; retourne le nombre d'alertes modifiées"""
+    result = db.execute(
+        update(Alert)
+        .where(and_(Alert.user_id == user_id, Alert.is_read == False))  # noqa: E712
+        .values(is_read=True)
+    )
+    # Soustraire plutôt que remettre à zéro : une alerte créée entre-temps reste comptée
+    if result.rowcount:
+        _adjust_unread_count(db, user_id, -result.rowcount)
+    db.commit()
+    return result.rowcount
+
+def prune_read_alerts(db: Session, older_than: datetime, batch_size: int = 1000) -> int:
+    """Supprimer un lot d'alertes lues plus anciennes que la date ; retourne le nombre supprimé"""
+    # Sélection bornée via l'index partiel ix_alert_read_created, puis suppression par clé primaire
+    ids = db.exec(
+        select(Alert.alert_id)
+        .where(and_(Alert.is_read == True, Alert.created_at < older_than))  # noqa: E712
+        .order_by(Alert.created_at)
+        .limit(batch_size)
+    ).all()
+    if not ids:
+        return 0
+    db.execute(delete(Alert).where(Alert.alert_id.in_(ids)))
+    db.commit()
+    return len(ids)
@@ -0,0 +1,255 @@
+import json
+from sqlmodel import Session, select, and_, func, case
+from app.core.cache import result_cache
+from app.core.periods import period_bounds
+from app.crud.user import get_data_version
+from app.models.forecast import ForecastSnapshot, ForecastGranularity
+from app.models.transaction import Transaction, TransactionType
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Nombre de périodes complètes d'historique utilisées pour la projection
+LOOKBACK = {ForecastGranularity.WEEKLY: 26, ForecastGranularity.MONTHLY: 12}
+# Lissage exponentiel : poids de la période la plus récente
+SMOOTHING_ALPHA = 0.4
+# Une série présente dans au moins 75% des périodes est considérée récurrente
+RECURRING_RATIO = 0.75
+MIN_PERIODS_FOR_RECURRING = 3
+
+def period_start(day: date, granularity: ForecastGranularity) -> date:
+    """Premier jour de la période contenant la date"""
+    return period_bounds(granularity.value, day)[0]
+
+def shift_period(start: date, granularity: ForecastGranularity, periods: int) -> date:
+    """Début de la période décalée de n périodes (n peut être négatif)"""
+    return period_bounds(granularity.value, start, periods)[0]
+
+def periods_ago(day: date, current_start: date, granularity: ForecastGranularity) -> int:
+    """Nombre de périodes entre la période de la date et la période courante"""
+    if granularity == ForecastGranularity.WEEKLY:
+        return (current_start - period_start(day, granularity)).days // 7
+    return (current_start.year * 12 + current_start.month) - (day.year * 12 + day.month)
+
+def get_forecast_inputs(
+    db: Session,
+    user_ids: List[str],
+    start_date: date,
+    end_date: date
+) -> Dict[str, dict]:
+    """Charger en deux requêtes l'historique journalier par série et le solde antérieur de chaque utilisateur"""
+    inputs = {user_id: {"history": [], "opening": 0, "has_older": False} for user_id in user_ids}
+
+    history_statement = select(
+        Transaction.user_id,
+        Transaction.type,
+        Transaction.category,
+        Transaction.date,
+        func.sum(Transaction.amount_cents)
+    ).where(
+        and_(
+            Transaction.user_id.in_(user_ids),
+            Transaction.date >= start_date,
+            Transaction.date <= end_date
+        )
+    ).group_by(Transaction.user_id, Transaction.type, Transaction.category, Transaction.date)
+    for user_id, transaction_type, category, day, total in db.exec(history_statement):
+        inputs[user_id]["history"].append((transaction_type, category, day, int(total)))
+
+    signed_amount = case(
+        (Transaction.type == TransactionType.INCOME, Transaction.amount_cents),
+        else_=-Transaction.amount_cents
+    )
+    opening_statement = select(
+        Transaction.user_id,
+        func.sum(signed_amount),
+        func.count()
+    ).where(
+        and_(Transaction.user_id.in_(user_ids), Transaction.date < start_date)
+    ).group_by(Transaction.user_id)
+    for user_id, net, count in db.exec(opening_statement):
+        inputs[user_id]["opening"] = int(net or 0)
+        inputs[user_id]["has_older"] = count > 0
+
+    return inputs
+
+def project_cash_flow(
+    history: List[tuple],
+    opening_balance: int,
+    has_older: bool,
+    today: date,
+    granularity: ForecastGranularity,
+    horizon: int
+) -> dict:
+    """Projeter revenus et dépenses par catégorie sur les prochaines périodes (en centimes).
+
+    Les séries (type, catégorie) régulières sont projetées par la médiane de leurs
+    montants non nuls ; les autres par une moyenne lissée exponentiellement.
+    La période courante vaut au moins le montant déjà constaté.
+    """
+    # Import différé : NumPy ne pèse pas sur le démarrage de l'API
+    import numpy as np
+
+    lookback = LOOKBACK[granularity]
+    current_start = period_start(today, granularity)
+
+    series_index: Dict[tuple, int] = {}
+    rows, cols, amounts = [], [], []
+    oldest = 0
+    for transaction_type, category, day, total in history:
+        ago = periods_ago(day, current_start, granularity)
+        row = series_index.setdefault((transaction_type, category), len(series_index))
+        rows.append(row)
+        cols.append(lookback - ago)  # colonne lookback = période courante
+        amounts.append(total)
+        oldest = max(oldest, ago)
+
+    matrix = np.zeros((len(series_index), lookback + 1))
+    np.add.at(matrix, (np.array(rows, dtype=int), np.array(cols, dtype=int)), np.array(amounts))
+    past, current = matrix[:, :lookback], matrix[:, lookback]
+    opening_balance += _signed_total(series_index, past.sum(axis=1))
+
+    # Ne pas compter comme nulles les périodes antérieures au premier mouvement
+    observed = lookback if has_older else min(max(oldest, 1), lookback)
+    past = past[:, lookback - observed:]
+
+    weights = SMOOTHING_ALPHA * (1 - SMOOTHING_ALPHA) ** np.arange(observed - 1, -1, -1)
+    smoothed = past @ weights / weights.sum()
+
+    active = past > 0
+    recurring = (active.mean(axis=1) >= RECURRING_RATIO) & (observed >= MIN_PERIODS_FOR_RECURRING)
+    projection = smoothed.copy()
+    if recurring.any():
+        typical = np.nanmedian(np.where(active[recurring], past[recurring], np.nan), axis=1)
+        projection[recurring] = typical
+
+    # Période courante : montant déjà constaté ou projection si elle est supérieure
+    per_period = np.tile(projection, (horizon, 1))
+    per_period[0] = np.maximum(current, projection)
+    is_income = np.array([t == TransactionType.INCOME for t, _ in series_index], dtype=bool)
+    income = per_period[:, is_income].sum(axis=1) if is_income.size else np.zeros(horizon)
+    expenses = per_period[:, ~is_income].sum(axis=1) if is_income.size else np.zeros(horizon)
+    closing = opening_balance + np.cumsum(income - expenses)
+
+    periods = []
+    for index in range(horizon):
+        start = shift_period(current_start, granularity, index)
+        periods.append({
+            "start_date": start,
+            "end_date": period_bounds(granularity.value, current_start, index)[1],
+            "income_cents": _cents(income[index]),
+            "expenses_cents": _cents(expenses[index]),
+            "net_cents": _cents(income[index]) - _cents(expenses[index]),
+            "closing_balance_cents": _cents(closing[index])
+        })
+
+    by_category = [
+        {
+            "type": transaction_type,
+            "category": category,
+            "recurring": bool(recurring[row]),
+            "amount_per_period_cents": _cents(projection[row]),
+            "current_period_to_date_cents": _cents(current[row])
+        }
+        for (transaction_type, category), row in series_index.items()
+    ]
+    by_category.sort(key=lambda item: item["amount_per_period_cents"], reverse=True)
+
+    return {
+        "granularity": granularity,
+        "horizon": horizon,
+        "opening_balance_cents": opening_balance,
+        "periods": periods,
+        "by_category": by_category
+    }
+
+def _cents(value: float) -> int:
+    """Arrondir une projection au centime entier"""
+    return int(round(float(value)))
+
+def _signed_total(series_index: Dict[tuple, int], totals: "np.ndarray") -> int:
+    """Somme des revenus moins les dépenses"""
+    return _cents(sum(
+        totals[row] if transaction_type == TransactionType.INCOME else -totals[row]
+        for (transaction_type, _), row in series_index.items()
+    ))
+
+def compute_forecasts(
+    db: Session,
+    user_ids: List[str],
+    granularity: ForecastGranularity,
+    horizon: int,
+    today: Optional[date] = None
+) -> Dict[str, dict]:
+    """Calculer les prévisions d'un lot d'utilisateurs avec les mêmes deux requêtes"""
+    today = today or date.today()
+    current_start = period_start(today, granularity)
+    history_start = shift_period(current_start, granularity, -LOOKBACK[granularity])
+    inputs = get_forecast_inputs(db, user_ids, history_start, today)
+    return {
+        user_id: project_cash_flow(
+            data["history"], data["opening"], data["has_older"], today, granularity, horizon
+        )
+        for user_id, data in inputs.items()
+    }
+
+def get_snapshot_forecast(
+    db: Session,
+    user_id: str,
+    data_version: int,
+    granularity: ForecastGranularity,
+    horizon: int,
+    today: date
+) -> Optional[dict]:
+    """Prévision du traitement nocturne si elle est encore à jour, sinon None.
+
+    À jour : calculée sur la version courante des données de l'utilisateur,
+    pour la période en cours et sur un horizon au moins égal.
+    """
+    snapshot = db.get(ForecastSnapshot, (user_id, granularity))
+    if snapshot is None or snapshot.data_version != data_version or snapshot.horizon < horizon:
+        return None
+    forecast = json.loads(snapshot.payload)
+    if forecast["periods"][0]["start_date"] != period_start(today, granularity).isoformat():
+        return None
+    # Les périodes projetées ne dépendent pas de l'horizon : on tronque
+    return {**forecast, "horizon": horizon, "periods": forecast["periods"][:horizon]}
+
+def get_forecast(
+    db: Session,
+    user_id: str,
+    granularity: ForecastGranularity,
+    horizon: int
+) -> dict:
+    """Prévision d'un utilisateur : instantané nocturne s'il est à jour, sinon calcul
+    à la demande ; mise en cache jusqu'à sa prochaine écriture"""
+    today = date.today()
+    data_version = get_data_version(db, user_id)
+    return result_cache.get_or_compute(
+        ("forecast", user_id, data_version, granularity, horizon, today),
+        [user_id],
+        lambda: get_snapshot_forecast(db, user_id, data_version, granularity, horizon, today)
+        or compute_forecasts(db, [user_id], granularity, horizon, today)[user_id]
+    )
+
+def save_forecast_snapshots(
+    db: Session,
+    forecasts: Dict[str, dict],
+    granularity: ForecastGranularity,
+    horizon: int,
+    data_versions: Dict[str, int]
+):
+    """Enregistrer (ou remplacer) les prévisions calculées par le traitement nocturne"""
+    computed_at = datetime.utcnow()
+    for user_id, forecast in forecasts.items():
+        db.merge(ForecastSnapshot(
+            user_id=user_id,
+            granularity=granularity,
+            horizon=horizon,
+            payload=json.dumps(forecast, default=str),
+            data_version=data_versions.get(user_id, 0),
+            computed_at=computed_at
+        ))
+    db.commit()
@@ -0,0 +1,180 @@
+from sqlalchemy import String, any_, bindparam, delete, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlmodel import Session, select, and_, func
+from app.core.cache import result_cache
+from app.models.household import Household, HouseholdMember, HouseholdCreate
+from app.models.transaction import Transaction, TransactionType
+from app.models.user import User
+from datetime import date, datetime
+from typing import List, Optional
+
+def household_tag(household_id: str) -> str:
+    """Étiquette de cache invalidée quand la composition du foyer change"""
+    return f"household:{household_id}"
+
+def create_household(db: Session, household: HouseholdCreate, owner_id: str) -> Household:
+    """Créer un foyer dont le créateur est le premier membre"""
+    db_household = Household(
+        **household.dict(),
+        owner_id=owner_id
+    )
+    db.add(db_household)
+    db.add(HouseholdMember(household_id=db_household.household_id, user_id=owner_id, pending=False))
+    db.commit()
+    db.refresh(db_household)
+    return db_household
+
+def get_household_for_member(
+    db: Session,
+    household_id: str,
+    user_id: str,
+    pending: bool = False
+) -> Optional[Household]:
+    """Récupérer un foyer si l'utilisateur en est membre (ou invité, avec pending=True)"""
+    statement = select(Household).join(
+        HouseholdMember, HouseholdMember.household_id == Household.household_id
+    ).where(
+        and_(
+            Household.household_id == household_id,
+            HouseholdMember.user_id == user_id,
+            HouseholdMember.pending == pending
+        )
+    )
+    return db.exec(statement).first()
+
+def get_households_for_user(db: Session, user_id: str, pending: bool = False) -> List[Household]:
+    """Récupérer les foyers dont l'utilisateur est membre (ou les invitations en attente)"""
+    statement = select(Household).join(
+        HouseholdMember, HouseholdMember.household_id == Household.household_id
+    ).where(
+        and_(HouseholdMember.user_id == user_id, HouseholdMember.pending == pending)
+    ).order_by(Household.created_at)
+    return db.exec(statement).all()
+
+def get_member_ids(db: Session, household_id: str, pending: bool = False) -> List[str]:
+    """Identifiants des membres d'un foyer (ou des invités, avec pending=True)"""
+    statement = select(HouseholdMember.user_id).where(
+        and_(HouseholdMember.household_id == household_id, HouseholdMember.pending == pending)
+    ).order_by(HouseholdMember.joined_at)
+    return db.exec(statement).all()
+
+def get_member_versions(db: Session, household_id: str) -> List[tuple]:
+    """Membres ayant accepté et version de leurs données, en une requête"""
+    statement = select(HouseholdMember.user_id, User.data_version).join(
+        User, User.user_id == HouseholdMember.user_id
+    ).where(
+        and_(HouseholdMember.household_id == household_id, HouseholdMember.pending == False)  # noqa: E712
+    ).order_by(HouseholdMember.joined_at)
+    return [tuple(row) for row in db.exec(statement).all()]
+
+def add_member(db: Session, household_id: str, user_id: str) -> bool:
+    """Inviter un utilisateur ; retourne False s'il était déjà membre ou invité"""
+    if db.get(HouseholdMember, (household_id, user_id)):
+        return False
+    db.add(HouseholdMember(household_id=household_id, user_id=user_id, pending=True))
+    db.commit()
+    return True
+
+def accept_invitation(db: Session, household_id: str, user_id: str) -> bool:
+    """Accepter une invitation ; retourne False s'il n'y en avait pas"""
+    result = db.execute(
+        update(HouseholdMember)
+        .where(
+            and_(
+                HouseholdMember.household_id == household_id,
+                HouseholdMember.user_id == user_id,
+                HouseholdMember.pending == True  # noqa: E712
+            )
+        )
+        .values(pending=False, joined_at=datetime.utcnow())
+    )
+    db.commit()
+    result_cache.invalidate(household_tag(household_id))
+    return result.rowcount > 0
+
+def remove_member(db: Session, household_id: str, user_id: str) -> bool:
+    """Retirer un membre ; retourne False s'il n'en faisait pas partie"""
+    result = db.execute(
+        delete(HouseholdMember).where(
+            and_(HouseholdMember.household_id == household_id, HouseholdMember.user_id == user_id)
+        )
+    )
+    db.commit()
+    result_cache.invalidate(household_tag(household_id))
+    return result.rowcount > 0
+
+def _user_id_in(db: Session, user_ids: List[str]):
+    """Filtre sur plusieurs utilisateurs : user_id = ANY(:ids) sur PostgreSQL (un seul
+    paramètre, plan stable quel que soit le nombre de membres), IN (...) ailleurs"""
+    if db.get_bind().dialect.name == "postgresql":
+        return Transaction.user_id == any_(bindparam("member_ids", user_ids, type_=ARRAY(String)))
+    return Transaction.user_id.in_(user_ids)
+
+def get_household_summary(
+    db: Session,
+    household_id: str,
+    member_ids: List[str],
+    start_date: date,
+    end_date: date
+) -> dict:
+    """Solde, dépenses par catégorie et totaux par membre d'un foyer (en centimes), en une seule requête"""
+    statement = select(
+        Transaction.user_id,
+        Transaction.type,
+        Transaction.category,
+        func.sum(Transaction.amount_cents)
+    ).where(
+        and_(
+            _user_id_in(db, member_ids),
+            Transaction.date >= start_date,
+            Transaction.date <= end_date
+        )
+    ).group_by(Transaction.user_id, Transaction.type, Transaction.category)
+
+    members = {
+        user_id: {"user_id": user_id, "total_income_cents": 0, "total_expenses_cents": 0}
+        for user_id in member_ids
+    }
+    expenses_by_category = {}
+    for user_id, transaction_type, category, total in db.exec(statement):
+        total = int(total)
+        if transaction_type == TransactionType.INCOME:
+            members[user_id]["total_income_cents"] += total
+        else:
+            members[user_id]["total_expenses_cents"] += total
+            expenses_by_category[category] = expenses_by_category.get(category, 0) + total
+
+    for member in members.values():
+        member["balance_cents"] = member["total_income_cents"] - member["total_expenses_cents"]
+    total_income = sum(m["total_income_cents"] for m in members.values())
+    total_expenses = sum(m["total_expenses_cents"] for m in members.values())
+
+    return {
+        "household_id": household_id,
+        "balance": {
+            "total_income_cents": total_income,
+            "total_expenses_cents": total_expenses,
+            "balance_cents": total_income - total_expenses
+        },
+        "expenses_by_category": [
+            {"category": category, "amount_cents": amount} for category, amount in expenses_by_category.items()
+        ],
+        "members": list(members.values())
+    }
+
+def get_cached_household_summary(
+    db: Session,
+    household_id: str,
+    start_date: date,
+    end_date: date
+) -> dict:
+    """Résumé du foyer, mis en cache jusqu'à la prochaine écriture d'un membre"""
+    # Composition et versions lues en base : la clé change quel que soit le worker
+    # qui a écrit
+    members = tuple(get_member_versions(db, household_id))
+    member_ids = [user_id for user_id, _ in members]
+    return result_cache.get_or_compute(
+        ("household-summary", household_id, members, start_date, end_date),
+        [household_tag(household_id), *member_ids],
+        lambda: get_household_summary(db, household_id, member_ids, start_date, end_date)
+    )
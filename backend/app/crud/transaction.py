@@ -1,16 +1,23 @@
-from sqlmodel import Session, select, and_, func
+from sqlmodel import Session, select, and_, or_, func, case
+from app.core.cache import result_cache
+from app.core.money import to_cents
+from app.core.periods import comparison_bounds
+from app.crud.user import bump_data_version, get_data_version
 from app.models.transaction import Transaction, TransactionCreate, TransactionUpdate, TransactionType
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 def create_transaction(db: Session, transaction: TransactionCreate, user_id: str) -> Transaction:
     """Créer une nouvelle transaction"""
     db_transaction = Transaction(
-        **transaction.dict(),
+        **transaction.dict(exclude={"amount"}),
+        amount_cents=to_cents(transaction.amount, transaction.currency),
         user_id=user_id
     )
     db.add(db_transaction)
+    bump_data_version(db, user_id)
     db.commit()
+    result_cache.invalidate(user_id)
     db.refresh(db_transaction)
     return db_transaction
 
@@ -21,18 +28,23 @@ def get_transaction_by_id(db: Session, transaction_id: str, user_id: str) -> Opt
     )
     return db.exec(statement).first()
 
-def get_transactions(
-    db: Session, 
-    user_id: str, 
-    skip: int = 0, 
-    limit: int = 100,
+# Colonnes sélectionnables via le paramètre fields= (projection SQL)
+TRANSACTION_FIELDS = (
+    "transaction_id", "user_id", "amount", "currency", "type", "category", "description", "date", "created_at"
+)
+# Champ d'API -> colonne (le montant est stocké en centimes)
+_FIELD_COLUMNS = {"amount": "amount_cents"}
+
+def _filter_transactions(
+    statement,
+    user_id: str,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     transaction_type: Optional[TransactionType] = None,
     category: Optional[str] = None
-) -> List[Transaction]:
-    """Récupérer les transactions avec filtres"""
-    statement = select(Transaction).where(Transaction.user_id == user_id)
+):
+    """Appliquer les filtres communs aux listes de transactions"""
+    statement = statement.where(Transaction.user_id == user_id)
     
     if start_date:
         statement = statement.where(Transaction.date >= start_date)
@@ -43,9 +55,51 @@ def get_transactions(
     if category:
         statement = statement.where(Transaction.category == category)
     
+    return statement
+
+def get_transactions(
+    db: Session, 
+    user_id: str, 
+    skip: int = 0, 
+    limit: int = 100,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    transaction_type: Optional[TransactionType] = None,
+    category: Optional[str] = None
+) -> List[Transaction]:
+    """Récupérer les transactions avec filtres"""
+    statement = _filter_transactions(
+        select(Transaction), user_id, start_date, end_date, transaction_type, category
+    )
+    
     statement = statement.offset(skip).limit(limit).order_by(Transaction.date.desc())
     return db.exec(statement).all()
 
+def get_transaction_columns(
+    db: Session,
+    user_id: str,
+    fields: List[str],
+    skip: int = 0,
+    limit: int = 100,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    transaction_type: Optional[TransactionType] = None,
+    category: Optional[str] = None
+) -> List[tuple]:
+    """Récupérer uniquement les colonnes demandées (une ligne = un tuple dans l'ordre de fields ;
+    "amount" est renvoyé en centimes)"""
+    columns = [getattr(Transaction, _FIELD_COLUMNS.get(field, field)) for field in fields]
+    statement = _filter_transactions(
+        select(*columns), user_id, start_date, end_date, transaction_type, category
+    )
+    
+    statement = statement.offset(skip).limit(limit).order_by(Transaction.date.desc())
+    rows = db.exec(statement).all()
+    # Avec une seule colonne, SQLModel renvoie des scalaires
+    if len(columns) == 1:
+        return [(value,) for value in rows]
+    return [tuple(row) for row in rows]
+
 def update_transaction(
     db: Session, 
     transaction_id: str, 
@@ -58,11 +112,16 @@ def update_transaction(
         return None
     
     update_data = transaction_update.dict(exclude_unset=True)
+    amount = update_data.pop("amount", None)
+    if amount is not None:
+        update_data["amount_cents"] = to_cents(amount, db_transaction.currency)
     for field, value in update_data.items():
         setattr(db_transaction, field, value)
     
     db.add(db_transaction)
+    bump_data_version(db, user_id)
     db.commit()
+    result_cache.invalidate(user_id)
     db.refresh(db_transaction)
     return db_transaction
 
@@ -73,37 +132,33 @@ def delete_transaction(db: Session, transaction_id: str, user_id: str) -> bool:
         return False
     
     db.delete(db_transaction)
+    bump_data_version(db, user_id)
     db.commit()
+    result_cache.invalidate(user_id)
     return True
 
 def get_balance(db: Session, user_id: str, start_date: date, end_date: date) -> dict:
-    """Calculer le solde (revenus - dépenses) pour une période"""
-    # Revenus
-    income_statement = select(func.sum(Transaction.amount)).where(
+    """Calculer le solde (revenus - dépenses) pour une période, en centimes"""
+    # Une seule agrégation entière (exacte) pour les deux types
+    statement = select(
+        Transaction.type,
+        func.sum(Transaction.amount_cents)
+    ).where(
         and_(
             Transaction.user_id == user_id,
-            Transaction.type == TransactionType.INCOME,
             Transaction.date >= start_date,
             Transaction.date <= end_date
         )
-    )
-    total_income = db.exec(income_statement).first() or 0
+    ).group_by(Transaction.type)
+    totals = {transaction_type: int(total) for transaction_type, total in db.exec(statement)}
     
-    # Dépenses
-    expense_statement = select(func.sum(Transaction.amount)).where(
-        and_(
-            Transaction.user_id == user_id,
-            Transaction.type == TransactionType.EXPENSE,
-            Transaction.date >= start_date,
-            Transaction.date <= end_date
-        )
-    )
-    total_expenses = db.exec(expense_statement).first() or 0
+    total_income = totals.get(TransactionType.INCOME, 0)
+    total_expenses = totals.get(TransactionType.EXPENSE, 0)
     
     return {
-        "total_income": float(total_income),
-        "total_expenses": float(total_expenses),
-        "balance": float(total_income) - float(total_expenses)
+        "total_income_cents": total_income,
+        "total_expenses_cents": total_expenses,
+        "balance_cents": total_income - total_expenses
     }
 
 def get_expenses_by_category(
@@ -112,10 +167,10 @@ def get_expenses_by_category(
     start_date: date, 
     end_date: date
 ) -> List[dict]:
-    """Obtenir les dépenses regroupées par catégorie"""
+    """Obtenir les dépenses regroupées par catégorie (en centimes)"""
     statement = select(
         Transaction.category,
-        func.sum(Transaction.amount).label("total")
+        func.sum(Transaction.amount_cents).label("total")
     ).where(
         and_(
             Transaction.user_id == user_id,
@@ -126,4 +181,98 @@ def get_expenses_by_category(
     ).group_by(Transaction.category)
     
     results = db.exec(statement).all()
-    return [{"category": category, "amount": float(total)} for category, total in results]
\ No newline at end of file
+    return [{"category": category, "amount_cents": int(total)} for category, total in results]
+
+def _change(current: int, previous: Optional[int]) -> dict:
+    """Écart avec la période précédente et variation en % (None si elle est nulle)"""
+    if previous is None:
+        return {"delta_cents": None, "change_pct": None}
+    return {
+        "delta_cents": current - previous,
+        "change_pct": round((current - previous) * 100 / previous, 1) if previous else None
+    }
+
+def compare_periods(
+    db: Session,
+    user_id: str,
+    bounds: Tuple[Tuple[date, date], ...]
+) -> dict:
+    """Revenus, dépenses et dépenses par catégorie de plusieurs périodes en une requête groupée.
+
+    Chaque transaction est rattachée à l'indice de sa période par un CASE sur les
+    bornes ; les périodes sont ordonnées de la plus récente à la plus ancienne et
+    chaque écart est calculé par rapport à la période suivante (plus ancienne).
+    """
+    in_period = [and_(Transaction.date >= start, Transaction.date <= end) for start, end in bounds]
+    # Sous-requête : le GROUP BY porte sur la colonne calculée et non sur le CASE
+    # répété (PostgreSQL ne rapproche pas deux CASE aux paramètres distincts)
+    tagged = select(
+        case(*((condition, index) for index, condition in enumerate(in_period))).label("period_index"),
+        Transaction.type,
+        Transaction.category,
+        Transaction.amount_cents
+    ).where(
+        and_(Transaction.user_id == user_id, or_(*in_period))
+    ).subquery()
+    statement = select(
+        tagged.c.period_index,
+        tagged.c.type,
+        tagged.c.category,
+        func.sum(tagged.c.amount_cents)
+    ).group_by(tagged.c.period_index, tagged.c.type, tagged.c.category)
+
+    count = len(bounds)
+    income = [0] * count
+    expenses = [0] * count
+    by_category: Dict[str, List[int]] = {}
+    for index, transaction_type, category, total in db.exec(statement):
+        total = int(total)
+        if transaction_type == TransactionType.INCOME:
+            income[index] += total
+        else:
+            expenses[index] += total
+            by_category.setdefault(category, [0] * count)[index] += total
+
+    def previous(values: List[int], index: int) -> Optional[int]:
+        return values[index + 1] if index + 1 < count else None
+
+    periods = []
+    for index, (start, end) in enumerate(bounds):
+        change = _change(expenses[index], previous(expenses, index))
+        periods.append({
+            "start_date": start,
+            "end_date": end,
+            "total_income_cents": income[index],
+            "total_expenses_cents": expenses[index],
+            "balance_cents": income[index] - expenses[index],
+            "expenses_delta_cents": change["delta_cents"],
+            "expenses_change_pct": change["change_pct"]
+        })
+    categories = [
+        {
+            "category": category,
+            "periods": [
+                {"amount_cents": amount, **_change(amount, previous(amounts, index))}
+                for index, amount in enumerate(amounts)
+            ]
+        }
+        for category, amounts in sorted(by_category.items(), key=lambda item: item[1], reverse=True)
+    ]
+    return {"periods": periods, "categories": categories}
+
+def get_period_comparison(
+    db: Session,
+    user_id: str,
+    period: str,
+    count: int,
+    year_over_year: bool = False
+) -> dict:
+    """Comparaison des count dernières périodes, mise en cache jusqu'à la prochaine écriture"""
+    today = date.today()
+    bounds = comparison_bounds(period, today, count, year_over_year)
+    comparison = result_cache.get_or_compute(
+        ("period-comparison", user_id, get_data_version(db, user_id), bounds),
+        [user_id],
+        lambda: compare_periods(db, user_id, bounds)
+    )
+    return {"period": period, "year_over_year": year_over_year, **comparison}
@@ -1,7 +1,8 @@
+from sqlalchemy import update
 from sqlmodel import Session, select
 from app.models.user import User, UserCreate
 from app.core.security import get_password_hash, verify_password
-from typing import Optional
+from typing import Dict, List, Optional
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     """Récupérer un utilisateur par email"""
@@ -32,4 +33,22 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
         return None
     if not verify_password(password, user.hashed_password):
         return None
-    return user
\ No newline at end of file
+    return user
+
+def bump_data_version(db: Session, user_id: str):
+    """Marquer les données de l'utilisateur comme modifiées (dans la transaction d'écriture)"""
+    db.execute(
+        update(User)
+        .where(User.user_id == user_id)
+        .values(data_version=User.data_version + 1)
+    )
+
+def get_data_version(db: Session, user_id: str) -> int:
+    """Version des données de l'utilisateur (déjà chargé par l'authentification en général)"""
+    user = db.get(User, user_id)
+    return user.data_version if user else 0
+
+def get_data_versions(db: Session, user_ids: List[str]) -> Dict[str, int]:
+    """Versions des données d'un lot d'utilisateurs, en une requête"""
+    statement = select(User.user_id, User.data_version).where(User.user_id.in_(user_ids))
+    return dict(db.exec(statement).all())
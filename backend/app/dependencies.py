@@ -1,13 +1,24 @@
+from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlmodel import Session
-from app.core.database import get_session
+from app.core.config import settings
+from app.core.database import get_session, pool_monitor
+from app.core.rate_limit import ConcurrencyLimiter, InFlightTracker, build_rate_limiter, retry_after_header
 from app.core.security import verify_token
 from app.crud.user import get_user_by_email
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
+rate_limiter = build_rate_limiter(
+    settings.RATE_LIMIT_REDIS_URL,
+    settings.RATE_LIMIT_PER_MINUTE,
+    settings.RATE_LIMIT_BURST
+)
+
+in_flight = InFlightTracker()
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_session)
@@ -27,4 +38,69 @@ async def get_current_user(
     if user is None:
         raise credentials_exception
     
-    return user
\ No newline at end of file
+    return user
+
+async def shed_load(token: str = Depends(oauth2_scheme)):
+    """Quand l'attente du pool de connexions devient trop longue, refuser les requêtes
+    des seuls utilisateurs qui ont déjà en cours plus que leur part du pool"""
+    subject = verify_token(token)
+    if subject is None:
+        yield
+        return
+    overloaded = pool_monitor.wait_ms > settings.POOL_WAIT_SHED_THRESHOLD_MS
+    capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    if overloaded and in_flight.above_share(subject, capacity):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service overloaded, retry later",
+            headers=retry_after_header(settings.SHED_RETRY_AFTER_SECONDS)
+        )
+    in_flight.acquire(subject)
+    try:
+        yield
+    finally:
+        in_flight.release(subject)
+
+async def rate_limit_user(token: str = Depends(oauth2_scheme)):
+    """Limiter le débit de requêtes par utilisateur authentifié.
+
+    Le seau est indexé par le sujet du JWT, sans ouvrir de session : un client
+    limité n'occupe jamais de connexion du pool. Un jeton invalide est refusé
+    ensuite par get_current_user.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    subject = verify_token(token)
+    if subject is None:
+        return
+    wait = rate_limiter.acquire(subject)
+    if wait > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded",
+            headers=retry_after_header(wait)
+        )
+
+class RouteConcurrencyLimit:
+    """Dépendance plafonnant le nombre de requêtes simultanées sur une route"""
+
+    def __init__(self, limit: Optional[int] = None):
+        # Sans limite explicite, HEAVY_ROUTE_MAX_CONCURRENCY est relu à chaque requête :
+        # les routes sont créées à l'import, avant un éventuel changement du réglage
+        self.limit = limit
+        self.limiter = ConcurrencyLimiter(settings.HEAVY_ROUTE_MAX_CONCURRENCY if limit is None else limit)
+
+    async def __call__(self, token: str = Depends(oauth2_scheme)):
+        if self.limit is None:
+            self.limiter.limit = settings.HEAVY_ROUTE_MAX_CONCURRENCY
+        subject = verify_token(token)
+        if not self.limiter.try_acquire(subject):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent requests on this route",
+                headers=retry_after_header(settings.SHED_RETRY_AFTER_SECONDS)
+            )
+        try:
+            yield
+        finally:
+            self.limiter.release(subject)
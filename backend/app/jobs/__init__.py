@@ -0,0 +1 @@
+# Traitements planifiés (exécuter depuis backend/ : python -m app.jobs.<nom>)
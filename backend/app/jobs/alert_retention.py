@@ -0,0 +1,42 @@
+"""Traitement planifié : purge des alertes lues anciennes.
+
+La suppression se fait par petits lots, chacun dans sa propre transaction, avec
+une courte pause entre les lots : les verrous restent brefs et la réplication
+n'a jamais à absorber une énorme transaction.
+
+    python -m app.jobs.alert_retention --days 90 --batch-size 1000
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from sqlmodel import Session
+
+from app.core import database
+from app.crud.alert import prune_read_alerts
+
+def run(days: int, batch_size: int, pause: float) -> int:
+    """Purger les alertes lues de plus de `days` jours ; retourne le nombre supprimé"""
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    total = 0
+    with Session(database.get_engine()) as db:
+        while True:
+            deleted = prune_read_alerts(db, cutoff, batch_size)
+            total += deleted
+            if deleted < batch_size:
+                return total
+            time.sleep(pause)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--pause", type=float, default=0.05, help="Pause entre deux lots (secondes)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    total = run(args.days, args.batch_size, args.pause)
+    print(f"{total} alertes supprimées en {time.perf_counter() - started:.1f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Traitement nocturne : prévision de trésorerie pour l'ensemble des utilisateurs.
+
+Les utilisateurs sont découpés en lots traités par un pool de processus ; chaque
+lot est chargé en deux requêtes puis projeté avec NumPy, et les résultats sont
+enregistrés dans ForecastSnapshot, servis par /dashboard/forecast tant que
+l'utilisateur n'a pas écrit depuis.
+
+    python -m app.jobs.forecast_batch --workers 4 --granularity monthly --horizon 3
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import List
+
+from sqlmodel import Session, select
+
+from app.core import database
+from app.crud.forecast import compute_forecasts, save_forecast_snapshots
+from app.crud.user import get_data_versions
+from app.models.forecast import ForecastGranularity
+from app.models.user import User
+
+def _init_worker():
+    """Ne pas réutiliser dans les processus fils les connexions héritées du parent"""
+    if database.engine is not None:
+        database.engine.dispose(close=False)
+
+def process_batch(user_ids: List[str], granularity: ForecastGranularity, horizon: int, today: date) -> int:
+    """Calculer et enregistrer les prévisions d'un lot d'utilisateurs"""
+    with Session(database.get_engine()) as db:
+        # Versions lues avant l'historique : une écriture concurrente rend l'instantané périmé
+        data_versions = get_data_versions(db, user_ids)
+        forecasts = compute_forecasts(db, user_ids, granularity, horizon, today)
+        save_forecast_snapshots(db, forecasts, granularity, horizon, data_versions)
+    return len(forecasts)
+
+def run(workers: int, batch_size: int, granularity: ForecastGranularity, horizon: int) -> int:
+    """Traiter tous les utilisateurs ; retourne le nombre de prévisions enregistrées"""
+    with Session(database.get_engine()) as db:
+        user_ids = list(db.exec(select(User.user_id).order_by(User.user_id)))
+    batches = [user_ids[i:i + batch_size] for i in range(0, len(user_ids), batch_size)]
+    today = date.today()
+
+    if workers <= 1:
+        return sum(process_batch(batch, granularity, horizon, today) for batch in batches)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        results = pool.map(
+            process_batch,
+            batches,
+            [granularity] * len(batches),
+            [horizon] * len(batches),
+            [today] * len(batches)
+        )
+        return sum(results)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--granularity", type=ForecastGranularity, default=ForecastGranularity.MONTHLY)
+    parser.add_argument("--horizon", type=int, default=3)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    count = run(args.workers, args.batch_size, args.granularity, args.horizon)
+    print(f"{count} prévisions enregistrées en {time.perf_counter() - started:.1f} s")
+
+if __name__ == "__main__":
+    main()
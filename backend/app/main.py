@@ -1,15 +1,24 @@
-from fastapi import FastAPI, Depends, HTTPException
+from contextlib import asynccontextmanager
+import math
+from fastapi import FastAPI, Depends, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.security import OAuth2PasswordBearer
-from sqlmodel import SQLModel, create_engine, Session
-import os
-from dotenv import load_dotenv
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 
+# Les variables d'environnement (.env compris) sont lues par Settings
 from app.core.config import settings
-from app.routers import auth, transactions, budgets, dashboard
+from app.core.database import init_engine, dispose_engine
+from app.dependencies import rate_limit_user, shed_load
+from app.routers import auth, transactions, budgets, dashboard, alerts, households
 
-# Chargement des variables d'environnement
-load_dotenv()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Créer le moteur et préchauffer le pool au démarrage, le fermer à l'arrêt"""
+    init_engine(warm_connections=settings.DB_POOL_WARMUP)
+    yield
+    dispose_engine()
 
 # Création de l'application FastAPI
 app = FastAPI(
@@ -17,7 +26,8 @@ app = FastAPI(
     description="API pour la gestion des finances personnelles",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Configuration CORS
@@ -29,11 +39,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compression des réponses volumineuses : brotli si installé (gzip en repli), sinon gzip
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(BrotliMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE, gzip_fallback=True)
+except ImportError:
+    app.add_middleware(GZipMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE, compresslevel=6)
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """422 standard ; une valeur saisie infinie ou NaN n'est pas sérialisable en JSON"""
+    errors = [
+        {**error, "input": str(error["input"])}
+        if isinstance(error.get("input"), float) and not math.isfinite(error["input"]) else error
+        for error in exc.errors()
+    ]
+    return JSONResponse(status_code=422, content={"detail": jsonable_encoder(errors)})
+
+# Contrôle d'admission : délestage des utilisateurs au-delà de leur part du pool, puis
+# limite de débit par utilisateur, avant d'occuper une connexion
+admission = [Depends(shed_load), Depends(rate_limit_user)]
+
 # Inclusion des routeurs
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["authentication"])
-app.include_router(transactions.router, prefix="/api/v1/transactions", tags=["transactions"])
+app.include_router(transactions.router, prefix="/api/v1/transactions", tags=["transactions"], dependencies=admission)
 app.include_router(budgets.router, prefix="/api/v1/budgets", tags=["budgets"])
-app.include_router(dashboard.router, prefix="/api/v1/dashboard", tags=["dashboard"])
+app.include_router(dashboard.router, prefix="/api/v1/dashboard", tags=["dashboard"], dependencies=admission)
+app.include_router(alerts.router, prefix="/api/v1/alerts", tags=["alerts"], dependencies=admission)
+app.include_router(households.router, prefix="/api/v1/households", tags=["households"], dependencies=admission)
 
 @app.get("/")
 async def root():
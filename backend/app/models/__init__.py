@@ -3,10 +3,14 @@ from .user import User, UserCreate, UserResponse
 from .transaction import Transaction, TransactionCreate, TransactionUpdate, TransactionResponse, TransactionType, TransactionCategory
 from .budget import Budget, BudgetCreate, BudgetUpdate, BudgetResponse, BudgetPeriod
 from .alert import Alert, AlertCreate, AlertResponse, AlertType
+from .forecast import ForecastSnapshot, ForecastGranularity
+from .household import Household, HouseholdMember, HouseholdCreate, HouseholdMemberAdd, HouseholdResponse
 
 __all__ = [
     "User", "UserCreate", "UserResponse",
     "Transaction", "TransactionCreate", "TransactionUpdate", "TransactionResponse", "TransactionType", "TransactionCategory",
     "Budget", "BudgetCreate", "BudgetUpdate", "BudgetResponse", "BudgetPeriod",
-    "Alert", "AlertCreate", "AlertResponse", "AlertType"
+    "Alert", "AlertCreate", "AlertResponse", "AlertType",
+    "ForecastSnapshot", "ForecastGranularity",
+    "Household", "HouseholdMember", "HouseholdCreate", "HouseholdMemberAdd", "HouseholdResponse"
 ]
\ No newline at end of file
@@ -1,3 +1,4 @@
+from sqlalchemy import Index, text
 from sqlmodel import SQLModel, Field
 from typing import Optional
 from datetime import datetime
@@ -19,6 +20,22 @@ class AlertBase(SQLModel):
 
 class Alert(AlertBase, table=True):
     """Modèle alerte pour la base de données"""
+    __table_args__ = (
+        # Liste complète (unread_only=False) : toutes les alertes d'un utilisateur par date.
+        # Les mêmes colonnes que ix_alert_user_unread, mais l'index partiel, plus petit,
+        # reste celui retenu pour la boîte non lue (plans vérifiés dans tests/test_alerts.py)
+        Index("ix_alert_user_created", "user_id", "created_at"),
+        # Index partiels : boîte de réception non lue, et alertes lues à purger
+        Index(
+            "ix_alert_user_unread", "user_id", "created_at",
+            postgresql_where=text("is_read = false"), sqlite_where=text("is_read = 0")
+        ),
+        Index(
+            "ix_alert_read_created", "created_at",
+            postgresql_where=text("is_read = true"), sqlite_where=text("is_read = 1")
+        ),
+    )
+    
     alert_id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     user_id: str = Field(foreign_key="user.user_id")
     created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
@@ -1,9 +1,14 @@
+from pydantic import field_validator
+from sqlalchemy import BigInteger
 from sqlmodel import SQLModel, Field
 from typing import Optional
 from datetime import datetime
 from enum import Enum
 import uuid
 
+from app.core.config import settings
+from app.core.money import to_cents, validate_currency
+
 class BudgetPeriod(str, Enum):
     """Périodes de budget"""
     WEEKLY = "weekly"
@@ -13,19 +18,42 @@ class BudgetPeriod(str, Enum):
 class BudgetBase(SQLModel):
     """Modèle de base pour les budgets"""
     category: str = Field(description="Catégorie du budget (ex: courses, transport, global)")
-    limit_amount: float = Field(gt=0, description="Montant limite du budget")
     period: BudgetPeriod = Field(default=BudgetPeriod.MONTHLY)
 
 class Budget(BudgetBase, table=True):
     """Modèle budget pour la base de données"""
     budget_id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     user_id: str = Field(foreign_key="user.user_id")
-    current_spent: float = Field(default=0.0, description="Montant déjà dépensé")
+    limit_cents: int = Field(sa_type=BigInteger, gt=0, description="Montant limite en centimes")
+    spent_cents: int = Field(
+        default=0,
+        sa_type=BigInteger,
+        sa_column_kwargs={"server_default": "0"},
+        description="Montant déjà dépensé en centimes"
+    )
+    currency: str = Field(
+        default=settings.DEFAULT_CURRENCY,
+        max_length=3,
+        sa_column_kwargs={"server_default": settings.DEFAULT_CURRENCY},
+        description="Code devise ISO 4217"
+    )
     created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
 
 class BudgetCreate(BudgetBase):
     """Modèle pour la création d'un budget"""
-    pass
+    limit_amount: float = Field(gt=0, description="Montant limite du budget")
+    currency: str = Field(default=settings.DEFAULT_CURRENCY, description="Devise de l'installation")
+
+    @field_validator("limit_amount")
+    @classmethod
+    def check_limit_amount(cls, value: float) -> float:
+        to_cents(value)  # montant fini et représentable en BIGINT
+        return value
+
+    @field_validator("currency")
+    @classmethod
+    def check_currency(cls, value: str) -> str:
+        return validate_currency(value)
 
 class BudgetUpdate(SQLModel):
     """Modèle pour la mise à jour d'un budget"""
@@ -34,6 +62,8 @@ class BudgetUpdate(SQLModel):
 
 class BudgetResponse(BudgetBase):
     """Modèle de réponse budget"""
+    limit_amount: float
+    currency: str
     budget_id: str
     user_id: str
     current_spent: float
@@ -0,0 +1,18 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+from enum import Enum
+
+class ForecastGranularity(str, Enum):
+    """Granularités de prévision"""
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+class ForecastSnapshot(SQLModel, table=True):
+    """Prévision de trésorerie pré-calculée par le traitement nocturne"""
+    user_id: str = Field(foreign_key="user.user_id", primary_key=True)
+    granularity: ForecastGranularity = Field(primary_key=True)
+    horizon: int = Field(description="Nombre de périodes projetées")
+    payload: str = Field(description="Prévision sérialisée en JSON")
+    data_version: int = Field(default=0, description="Version des données de l'utilisateur utilisée pour le calcul")
+    computed_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,40 @@
+from sqlalchemy import true
+from sqlmodel import SQLModel, Field
+from typing import List, Optional
+from datetime import datetime
+import uuid
+
+class HouseholdBase(SQLModel):
+    """Modèle de base pour les foyers (budgets partagés)"""
+    name: str = Field(description="Nom du foyer")
+
+class Household(HouseholdBase, table=True):
+    """Modèle foyer pour la base de données"""
+    household_id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
+    owner_id: str = Field(foreign_key="user.user_id")
+    created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
+
+class HouseholdMember(SQLModel, table=True):
+    """Appartenance d'un utilisateur à un foyer"""
+    household_id: str = Field(foreign_key="household.household_id", primary_key=True)
+    # Index sur user_id seul : lister les foyers d'un utilisateur
+    user_id: str = Field(foreign_key="user.user_id", primary_key=True, index=True)
+    # Invitation en attente : les données du membre ne sont partagées qu'après acceptation
+    pending: bool = Field(default=True, sa_column_kwargs={"server_default": true()})
+    joined_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
+
+class HouseholdCreate(HouseholdBase):
+    """Modèle pour la création d'un foyer"""
+    pass
+
+class HouseholdMemberAdd(SQLModel):
+    """Modèle pour l'invitation d'un membre (par email)"""
+    email: str
+
+class HouseholdResponse(HouseholdBase):
+    """Modèle de réponse foyer"""
+    household_id: str
+    owner_id: str
+    member_ids: List[str]
+    pending_member_ids: List[str] = Field(default_factory=list, description="Invitations non acceptées")
+    created_at: datetime
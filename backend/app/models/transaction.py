@@ -1,9 +1,14 @@
+from pydantic import field_validator
+from sqlalchemy import BigInteger, Index
 from sqlmodel import SQLModel, Field
-from typing import Optional
-from datetime import datetime, date
+from typing import Any, Dict, List, Optional
+from datetime import datetime, date as date_type
 from enum import Enum
 import uuid
 
+from app.core.config import settings
+from app.core.money import to_cents, validate_currency
+
 class TransactionType(str, Enum):
     """Types de transaction"""
     INCOME = "income"
@@ -31,21 +36,42 @@ class TransactionCategory(str, Enum):
 
 class TransactionBase(SQLModel):
     """Modèle de base pour les transactions"""
-    amount: float = Field(gt=0, description="Montant de la transaction")
     type: TransactionType
     category: TransactionCategory
     description: Optional[str] = None
-    date: date = Field(default_factory=date.today)
+    date: date_type = Field(default_factory=date_type.today)
 
 class Transaction(TransactionBase, table=True):
     """Modèle transaction pour la base de données"""
+    # Toutes les requêtes filtrent par utilisateur puis par plage de dates
+    __table_args__ = (Index("ix_transaction_user_date", "user_id", "date"),)
+    
     transaction_id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     user_id: str = Field(foreign_key="user.user_id")
+    amount_cents: int = Field(sa_type=BigInteger, gt=0, description="Montant en unités mineures (centimes)")
+    currency: str = Field(
+        default=settings.DEFAULT_CURRENCY,
+        max_length=3,
+        sa_column_kwargs={"server_default": settings.DEFAULT_CURRENCY},
+        description="Code devise ISO 4217"
+    )
     created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
 
 class TransactionCreate(TransactionBase):
     """Modèle pour la création d'une transaction"""
-    pass
+    amount: float = Field(gt=0, description="Montant de la transaction")
+    currency: str = Field(default=settings.DEFAULT_CURRENCY, description="Devise de l'installation")
+
+    @field_validator("amount")
+    @classmethod
+    def check_amount(cls, value: float) -> float:
+        to_cents(value)  # montant fini et représentable en BIGINT
+        return value
+
+    @field_validator("currency")
+    @classmethod
+    def check_currency(cls, value: str) -> str:
+        return validate_currency(value)
 
 class TransactionUpdate(SQLModel):
     """Modèle pour la mise à jour d'une transaction"""
@@ -53,10 +79,25 @@ class TransactionUpdate(SQLModel):
     type: Optional[TransactionType] = None
     category: Optional[TransactionCategory] = None
     description: Optional[str] = None
-    date: Optional[date] = None
+    date: Optional[date_type] = None
+
+    @field_validator("amount")
+    @classmethod
+    def check_amount(cls, value: Optional[float]) -> Optional[float]:
+        if value is not None:
+            to_cents(value)
+        return value
 
 class TransactionResponse(TransactionBase):
     """Modèle de réponse transaction"""
+    amount: float
+    currency: str
     transaction_id: str
     user_id: str
-    created_at: datetime
\ No newline at end of file
+    created_at: datetime
+
+class TransactionColumnarResponse(SQLModel):
+    """Réponse colonnaire de la liste (format=columnar) : un tableau de valeurs par champ"""
+    count: int
+    fields: List[str]
+    data: Dict[str, List[Any]]
@@ -11,6 +11,16 @@ class User(UserBase, table=True):
     """Modèle utilisateur pour la base de données"""
     user_id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     hashed_password: str
+    unread_alert_count: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": "0"},
+        description="Alertes non lues (compteur maintenu par les écritures)"
+    )
+    data_version: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": "0"},
+        description="Incrémenté à chaque écriture de transaction (clé des résultats en cache)"
+    )
     created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
 
 class UserCreate(UserBase):
@@ -0,0 +1,80 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlmodel import Session
+from typing import List
+
+from app.core.database import get_session
+from app.dependencies import get_current_user
+from app.crud.alert import get_alerts, mark_alert_read, mark_all_alerts_read
+from app.models.user import User
+from app.models.alert import AlertResponse
+
+router = APIRouter()
+
+@router.get("/", response_model=List[AlertResponse])
+async def read_alerts(
+    unread_only: bool = Query(False),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """Récupérer les alertes de l'utilisateur"""
+    alerts = get_alerts(
+        db=db,
+        user_id=current_user.user_id,
+        unread_only=unread_only,
+        skip=skip,
+        limit=limit
+    )
+    
+    return [
+        AlertResponse(
+            alert_id=a.alert_id,
+            user_id=a.user_id,
+            message=a.message,
+            alert_type=a.alert_type,
+            category=a.category,
+            is_read=a.is_read,
+            created_at=a.created_at
+        ) for a in alerts
+    ]
+
+@router.get("/unread-count")
+async def read_unread_count(
+    current_user: User = Depends(get_current_user)
+):
+    """Nombre d'alertes non lues (compteur dénormalisé, sans COUNT)"""
+    return {"unread_count": current_user.unread_alert_count}
+
+@router.post("/read-all")
+async def mark_all_read(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """Marquer toutes les alertes comme lues"""
+    updated = mark_all_alerts_read(db=db, user_id=current_user.user_id)
+    return {"updated": updated, "unread_count": current_user.unread_alert_count}
+
+@router.post("/{alert_id}/read", response_model=AlertResponse)
+async def mark_read(
+    alert_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """Marquer une alerte comme lue"""
+    alert = mark_alert_read(db=db, alert_id=alert_id, user_id=current_user.user_id)
+    if not alert:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Alert not found"
+        )
+    
+    return AlertResponse(
+        alert_id=alert.alert_id,
+        user_id=alert.user_id,
+        message=alert.message,
+        alert_type=alert.alert_type,
+        category=alert.category,
+        is_read=alert.is_read,
+        created_at=alert.created_at
+    )
@@ -1,18 +1,22 @@
 from fastapi import APIRouter, Depends, Query
 from sqlmodel import Session
 from typing import Optional
-from datetime import date, datetime, timedelta
+from datetime import date
 
 from app.core.database import get_session
-from app.dependencies import get_current_user
-from app.crud.transaction import get_balance, get_expenses_by_category
+from app.core.money import to_api_amounts
+from app.core.periods import PERIOD_PATTERN, resolve_period
+from app.dependencies import get_current_user, RouteConcurrencyLimit
+from app.crud.transaction import get_balance, get_expenses_by_category, get_period_comparison
+from app.crud.forecast import get_forecast
+from app.models.forecast import ForecastGranularity
 from app.models.user import User
 
 router = APIRouter()
 
 @router.get("/balance")
 async def get_dashboard_balance(
-    period: str = Query("monthly", regex="^(weekly|monthly|yearly)$"),
+    period: str = Query("monthly", regex=PERIOD_PATTERN),
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     current_user: User = Depends(get_current_user),
@@ -21,27 +25,12 @@ async def get_dashboard_balance(
     """Obtenir le solde pour le tableau de bord"""
     
     # Si les dates ne sont pas fournies, calculer selon la période
-    if not start_date or not end_date:
-        today = date.today()
-        
-        if period == "weekly":
-            start_date = today - timedelta(days=today.weekday())
-            end_date = start_date + timedelta(days=6)
-        elif period == "monthly":
-            start_date = today.replace(day=1)
-            # Dernier jour du mois
-            if today.month == 12:
-                end_date = today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
-            else:
-                end_date = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
-        elif period == "yearly":
-            start_date = today.replace(month=1, day=1)
-            end_date = today.replace(month=12, day=31)
+    start_date, end_date = resolve_period(period, start_date, end_date)
     
     balance = get_balance(db=db, user_id=current_user.user_id, start_date=start_date, end_date=end_date)
     
     return {
-        **balance,
+        **to_api_amounts(balance),
         "period": period,
         "start_date": start_date,
         "end_date": end_date
@@ -49,7 +38,7 @@ async def get_dashboard_balance(
 
 @router.get("/expenses-by-category")
 async def get_dashboard_expenses_by_category(
-    period: str = Query("monthly", regex="^(weekly|monthly|yearly)$"),
+    period: str = Query("monthly", regex=PERIOD_PATTERN),
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     current_user: User = Depends(get_current_user),
@@ -58,21 +47,7 @@ async def get_dashboard_expenses_by_category(
     """Obtenir la répartition des dépenses par catégorie"""
     
     # Si les dates ne sont pas fournies, calculer selon la période
-    if not start_date or not end_date:
-        today = date.today()
-        
-        if period == "weekly":
-            start_date = today - timedelta(days=today.weekday())
-            end_date = start_date + timedelta(days=6)
-        elif period == "monthly":
-            start_date = today.replace(day=1)
-            if today.month == 12:
-                end_date = today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
-            else:
-                end_date = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
-        elif period == "yearly":
-            start_date = today.replace(month=1, day=1)
-            end_date = today.replace(month=12, day=31)
+    start_date, end_date = resolve_period(period, start_date, end_date)
     
     expenses = get_expenses_by_category(
         db=db, 
@@ -82,35 +57,22 @@ async def get_dashboard_expenses_by_category(
     )
     
     return {
-        "expenses_by_category": expenses,
+        "expenses_by_category": to_api_amounts(expenses),
         "period": period,
         "start_date": start_date,
         "end_date": end_date
     }
 
-@router.get("/summary")
+@router.get("/summary", dependencies=[Depends(RouteConcurrencyLimit())])
 async def get_dashboard_summary(
-    period: str = Query("monthly", regex="^(weekly|monthly|yearly)$"),
+    period: str = Query("monthly", regex=PERIOD_PATTERN),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
     """Obtenir un résumé complet pour le tableau de bord"""
     
     # Calculer les dates selon la période
-    today = date.today()
-    
-    if period == "weekly":
-        start_date = today - timedelta(days=today.weekday())
-        end_date = start_date + timedelta(days=6)
-    elif period == "monthly":
-        start_date = today.replace(day=1)
-        if today.month == 12:
-            end_date = today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
-        else:
-            end_date = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
-    elif period == "yearly":
-        start_date = today.replace(month=1, day=1)
-        end_date = today.replace(month=12, day=31)
+    start_date, end_date = resolve_period(period)
     
     # Obtenir le solde
     balance = get_balance(db=db, user_id=current_user.user_id, start_date=start_date, end_date=end_date)
@@ -124,9 +86,43 @@ async def get_dashboard_summary(
     )
     
     return {
-        "balance": balance,
-        "expenses_by_category": expenses,
+        "balance": to_api_amounts(balance),
+        "expenses_by_category": to_api_amounts(expenses),
         "period": period,
         "start_date": start_date,
         "end_date": end_date
-    }
\ No newline at end of file
+    }
+
+@router.get("/compare", dependencies=[Depends(RouteConcurrencyLimit())])
+async def get_dashboard_comparison(
+    period: str = Query("monthly", regex=PERIOD_PATTERN),
+    periods: int = Query(2, ge=2, le=24),
+    year_over_year: bool = Query(False),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """Comparer les dépenses par catégorie sur plusieurs périodes (écarts et variations en %)"""
+    comparison = get_period_comparison(
+        db=db,
+        user_id=current_user.user_id,
+        period=period,
+        count=periods,
+        year_over_year=year_over_year
+    )
+    return to_api_amounts(comparison)
+
+@router.get("/forecast")
+async def get_dashboard_forecast(
+    granularity: ForecastGranularity = Query(ForecastGranularity.MONTHLY),
+    horizon: int = Query(3, ge=1, le=26),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """Prévoir revenus, dépenses et solde par catégorie sur les prochaines périodes"""
+    forecast = get_forecast(
+        db=db,
+        user_id=current_user.user_id,
+        granularity=granularity,
+        horizon=horizon
+    )
+    return to_api_amounts(forecast)
\ No newline at end of file
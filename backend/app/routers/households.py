@@ -0,0 +1,165 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlmodel import Session
+from typing import List
+
+from app.core.database import get_session
+from app.core.money import to_api_amounts
+from app.core.periods import PERIOD_PATTERN, resolve_period
+from app.dependencies import get_current_user, RouteConcurrencyLimit
+from app.crud.household import (
+    create_household,
+    get_household_for_member,
+    get_households_for_user,
+    get_member_ids,
+    add_member,
+    accept_invitation,
+    remove_member,
+    get_cached_household_summary
+)
+from app.crud.user import get_user_by_email
+from app.models.user import User
+from app.models.household import Household, HouseholdCreate, HouseholdMemberAdd, HouseholdResponse
+
+router = APIRouter()
+
+def _household_response(db: Session, household: Household) -> HouseholdResponse:
+    return HouseholdResponse(
+        household_id=household.household_id,
+        name=household.name,
+        owner_id=household.owner_id,
+        member_ids=get_member_ids(db, household.household_id),
+        pending_member_ids=get_member_ids(db, household.household_id, pending=True),
+        created_at=household.created_at
+    )
+
+def _get_household_or_404(db: Session, household_id: str, user: User, pending: bool = False) -> Household:
+    household = get_household_for_member(db=db, household_id=household_id, user_id=user.user_id, pending=pending)
+    if not household:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Household not found"
+        )
+    return household
+
+@router.post("/", response_model=HouseholdResponse)
+async def create_new_household(
+    household: HouseholdCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """Créer un foyer"""
+    db_household = create_household(db=db, household=household, owner_id=current_user.user_id)
+    return _household_response(db, db_household)
+
+@router.get("/", response_model=List[HouseholdResponse])
+async def read_households(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """Récupérer les foyers de l'utilisateur"""
+    households = get_households_for_user(db=db, user_id=current_user.user_id)
+    return [_household_response(db, h) for h in households]
+
+@router.get("/invitations", response_model=List[HouseholdResponse])
+async def read_household_invitations(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """Récupérer les invitations en attente de l'utilisateur"""
+    households = get_households_for_user(db=db, user_id=current_user.user_id, pending=True)
+    return [_household_response(db, h) for h in households]
+
+@router.post("/{household_id}/members", response_model=HouseholdResponse)
+async def add_household_member(
+    household_id: str,
+    member: HouseholdMemberAdd,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """Inviter un membre (réservé au propriétaire) : ses données ne sont partagées
+    qu'une fois l'invitation acceptée"""
+    household = _get_household_or_404(db, household_id, current_user)
+    if household.owner_id != current_user.user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only the household owner can add members"
+        )
+    
+    user = get_user_by_email(db, email=member.email)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
+    add_member(db=db, household_id=household_id, user_id=user.user_id)
+    return _household_response(db, household)
+
+@router.post("/{household_id}/accept", response_model=HouseholdResponse)
+async def accept_household_invitation(
+    household_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """Accepter une invitation et partager ses données avec le foyer"""
+    household = _get_household_or_404(db, household_id, current_user, pending=True)
+    accept_invitation(db=db, household_id=household_id, user_id=current_user.user_id)
+    return _household_response(db, household)
+
+@router.delete("/{household_id}/members/{user_id}")
+async def remove_household_member(
+    household_id: str,
+    user_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """Retirer un membre ou une invitation (le propriétaire, ou le membre lui-même
+    pour quitter le foyer ou décliner l'invitation)"""
+    household = get_household_for_member(
+        db=db, household_id=household_id, user_id=current_user.user_id
+    ) or _get_household_or_404(db, household_id, current_user, pending=True)
+    if current_user.user_id not in (household.owner_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only the household owner can remove other members"
+        )
+    if user_id == household.owner_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The household owner cannot be removed"
+        )
+    
+    if not remove_member(db=db, household_id=household_id, user_id=user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Member not found"
+        )
+    
+    return {"message": "Member removed successfully"}
+
+@router.get("/{household_id}/summary", dependencies=[Depends(RouteConcurrencyLimit())])
+async def get_household_summary(
+    household_id: str,
+    period: str = Query("monthly", regex=PERIOD_PATTERN),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """Obtenir le résumé agrégé de tous les membres du foyer"""
+    _get_household_or_404(db, household_id, current_user)
+    
+    # Calculer les dates selon la période
+    start_date, end_date = resolve_period(period)
+    
+    summary = get_cached_household_summary(
+        db=db,
+        household_id=household_id,
+        start_date=start_date,
+        end_date=end_date
+    )
+    
+    return {
+        **to_api_amounts(summary),
+        "period": period,
+        "start_date": start_date,
+        "end_date": end_date
+    }
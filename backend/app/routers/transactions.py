@@ -1,13 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import JSONResponse
 from sqlmodel import Session
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 from datetime import date, datetime, timedelta
 
 from app.core.database import get_session
-from app.dependencies import get_current_user
+from app.core.money import from_cents
+from app.dependencies import get_current_user, RouteConcurrencyLimit
 from app.crud.transaction import (
+    TRANSACTION_FIELDS,
     create_transaction, 
     get_transactions, 
+    get_transaction_columns,
     get_transaction_by_id,
     update_transaction,
     delete_transaction
@@ -17,11 +21,43 @@ from app.models.transaction import (
     TransactionCreate, 
     TransactionUpdate, 
     TransactionResponse,
+    TransactionColumnarResponse,
     TransactionType
 )
 
 router = APIRouter()
 
+def parse_fields(fields: Optional[str]) -> List[str]:
+    """Valider la liste de champs demandée (ex: "amount,category,date")"""
+    if not fields:
+        return list(TRANSACTION_FIELDS)
+    requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in TRANSACTION_FIELDS]
+    if not requested or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(TRANSACTION_FIELDS)}"
+        )
+    return requested
+
+def _column_values(field: str, values: list) -> list:
+    """Convertir une colonne en valeurs JSON (dates en ISO 8601, montants depuis les centimes)"""
+    if field == "amount":
+        return [from_cents(v) for v in values]
+    if field in ("date", "created_at"):
+        return [v.isoformat() if v is not None else None for v in values]
+    return list(values)
+
+def serialize_rows(fields: List[str], rows: List[tuple]) -> List[dict]:
+    """Format par lignes : une liste d'objets ne contenant que les champs demandés"""
+    columns = serialize_columns(fields, rows)
+    return [dict(zip(fields, values)) for values in zip(*(columns[f] for f in fields))]
+
+def serialize_columns(fields: List[str], rows: List[tuple]) -> dict:
+    """Format colonnaire : un tableau de valeurs par champ, dans le même ordre"""
+    columns = zip(*rows) if rows else [[] for _ in fields]
+    return {field: _column_values(field, values) for field, values in zip(fields, columns)}
+
 @router.post("/", response_model=TransactionResponse)
 async def create_new_transaction(
     transaction: TransactionCreate,
@@ -33,7 +69,8 @@ async def create_new_transaction(
     return TransactionResponse(
         transaction_id=db_transaction.transaction_id,
         user_id=db_transaction.user_id,
-        amount=db_transaction.amount,
+        amount=from_cents(db_transaction.amount_cents, db_transaction.currency),
+        currency=db_transaction.currency,
         type=db_transaction.type,
         category=db_transaction.category,
         description=db_transaction.description,
@@ -41,7 +78,20 @@ async def create_new_transaction(
         created_at=db_transaction.created_at
     )
 
-@router.get("/", response_model=List[TransactionResponse])
+# Formes de la liste : objets complets (par défaut), objets réduits aux champs de
+# fields=, ou format colonnaire ; les deux dernières sont sérialisées directement
+TRANSACTION_LIST_RESPONSES = {
+    200: {"description": "Objets complets ; objets réduits aux champs demandés (fields=) ; "
+                         "ou un tableau par champ (format=columnar)"},
+    400: {"description": "Champ inconnu dans fields"},
+}
+
+@router.get(
+    "/",
+    response_model=Union[List[TransactionResponse], List[Dict[str, Any]], TransactionColumnarResponse],
+    responses=TRANSACTION_LIST_RESPONSES,
+    dependencies=[Depends(RouteConcurrencyLimit())]
+)
 async def read_transactions(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
@@ -49,10 +99,30 @@ async def read_transactions(
     end_date: Optional[date] = Query(None),
     transaction_type: Optional[TransactionType] = Query(None),
     category: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None, description="Champs à retourner, séparés par des virgules (ex: amount,category,date)"),
+    format: str = Query("rows", regex="^(rows|columnar)$", description="rows : liste d'objets ; columnar : un tableau par champ"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
     """Récupérer les transactions de l'utilisateur"""
+    if fields or format == "columnar":
+        # Projection poussée dans le SELECT : seules les colonnes demandées sont lues
+        selected = parse_fields(fields)
+        rows = get_transaction_columns(
+            db=db,
+            user_id=current_user.user_id,
+            fields=selected,
+            skip=skip,
+            limit=limit,
+            start_date=start_date,
+            end_date=end_date,
+            transaction_type=transaction_type,
+            category=category
+        )
+        if format == "columnar":
+            return JSONResponse({"count": len(rows), "fields": selected, "data": serialize_columns(selected, rows)})
+        return JSONResponse(serialize_rows(selected, rows))
+    
     transactions = get_transactions(
         db=db,
         user_id=current_user.user_id,
@@ -68,7 +138,8 @@ async def read_transactions(
         TransactionResponse(
             transaction_id=t.transaction_id,
             user_id=t.user_id,
-            amount=t.amount,
+            amount=from_cents(t.amount_cents, t.currency),
+            currency=t.currency,
             type=t.type,
             category=t.category,
             description=t.description,
@@ -94,7 +165,8 @@ async def read_transaction(
     return TransactionResponse(
         transaction_id=transaction.transaction_id,
         user_id=transaction.user_id,
-        amount=transaction.amount,
+        amount=from_cents(transaction.amount_cents, transaction.currency),
+        currency=transaction.currency,
         type=transaction.type,
         category=transaction.category,
         description=transaction.description,
@@ -126,7 +198,8 @@ async def update_transaction_endpoint(
     return TransactionResponse(
         transaction_id=updated_transaction.transaction_id,
         user_id=updated_transaction.user_id,
-        amount=updated_transaction.amount,
+        amount=from_cents(updated_transaction.amount_cents, updated_transaction.currency),
+        currency=updated_transaction.currency,
         type=updated_transaction.type,
         category=updated_transaction.category,
         description=updated_transaction.description,
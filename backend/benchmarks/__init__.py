@@ -0,0 +1 @@
+# Scripts de benchmark (exécuter depuis backend/ : python -m benchmarks.<nom>)
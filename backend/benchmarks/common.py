@@ -0,0 +1,26 @@
+"""Utilitaires partagés par les benchmarks (bibliothèque standard uniquement)."""
+import socket
+import statistics
+import time
+
+def timed(func, repeat: int) -> float:
+    """Durée médiane d'un appel en millisecondes"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+def percentile(values, pct):
+    """Percentile par rang le plus proche"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def free_port() -> int:
+    """Port local libre pour le serveur de test"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
@@ -0,0 +1,100 @@
+"""Benchmark de /dashboard/forecast : latence à la demande et débit du traitement nocturne.
+
+Peuple une base dédiée (SQLite temporaire par défaut) avec un an d'historique par
+utilisateur, puis mesure le calcul à froid pour un utilisateur (objectif < 50 ms),
+la lecture depuis le cache, et le traitement par lots avec un pool de processus.
+
+    python -m benchmarks.forecast --users 200 --database-url sqlite:////tmp/forecast.db
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.core import database
+from app.core.cache import result_cache
+from app.core.money import to_cents
+from app.crud.forecast import compute_forecasts, get_forecast
+from app.jobs import forecast_batch
+from app.models.forecast import ForecastGranularity
+from app.models.transaction import Transaction, TransactionCategory, TransactionType
+from app.models.user import User
+
+EXPENSE_CATEGORIES = [
+    TransactionCategory.GROCERIES, TransactionCategory.TRANSPORT, TransactionCategory.RESTAURANT,
+    TransactionCategory.ENTERTAINMENT, TransactionCategory.HEALTHCARE, TransactionCategory.CLOTHING,
+]
+
+def seed(engine, users: int, days: int) -> list:
+    """Créer des utilisateurs avec salaire, loyer et dépenses courantes quotidiennes"""
+    rng = random.Random(7)
+    today = date.today()
+    user_ids = []
+    with Session(engine) as db:
+        for _ in range(users):
+            user = User(email=f"{uuid.uuid4()}@bench.local", hashed_password="x")
+            db.add(user)
+            user_ids.append(user.user_id)
+            rows = []
+            for offset in range(days):
+                day = today - timedelta(days=offset)
+                if day.day == 1:
+                    rows.append((2500.0, TransactionType.INCOME, TransactionCategory.SALARY, day))
+                    rows.append((900.0, TransactionType.EXPENSE, TransactionCategory.RENT, day))
+                for _ in range(rng.randint(0, 3)):
+                    rows.append((round(rng.uniform(3, 80), 2), TransactionType.EXPENSE, rng.choice(EXPENSE_CATEGORIES), day))
+            db.add_all(
+                Transaction(amount_cents=to_cents(amount), type=kind, category=category, date=day, user_id=user.user_id)
+                for amount, kind, category, day in rows
+            )
+            db.commit()
+    return user_ids
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--samples", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/forecast.db"
+    database.engine = create_engine(url)
+    SQLModel.metadata.create_all(database.engine)
+    started = time.perf_counter()
+    user_ids = seed(database.engine, args.users, args.days)
+    print(f"{args.users} utilisateurs x {args.days} jours créés en {time.perf_counter() - started:.1f} s ({url})")
+
+    granularity = ForecastGranularity.MONTHLY
+    cold, cached = [], []
+    with Session(database.engine) as db:
+        for user_id in random.Random(1).choices(user_ids, k=args.samples):
+            result_cache.invalidate(user_id)
+            started = time.perf_counter()
+            get_forecast(db, user_id, granularity, 3)
+            cold.append((time.perf_counter() - started) * 1000)
+            started = time.perf_counter()
+            get_forecast(db, user_id, granularity, 3)
+            cached.append((time.perf_counter() - started) * 1000)
+        example = compute_forecasts(db, [user_ids[0]], granularity, 3)[user_ids[0]]
+
+    cold.sort()
+    print(f"à la demande (sans cache) : p50 {statistics.median(cold):.1f} ms, p99 {cold[int(len(cold) * 0.99) - 1]:.1f} ms")
+    print(f"depuis le cache           : p50 {statistics.median(cached) * 1000:.0f} µs")
+    print(f"exemple fin de mois       : solde projeté {example['periods'][0]['closing_balance_cents'] / 100:.2f}")
+
+    for workers in sorted({1, args.workers}):
+        started = time.perf_counter()
+        count = forecast_batch.run(workers, 50, granularity, 3)
+        elapsed = time.perf_counter() - started
+        print(f"traitement par lots ({workers} processus) : {count / elapsed:.0f} utilisateurs/s")
+
+if __name__ == "__main__":
+    main()
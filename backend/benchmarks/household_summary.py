@@ -0,0 +1,73 @@
+"""Benchmark du résumé de foyer : une requête agrégée contre N appels /dashboard/summary.
+
+Peuple une base dédiée (SQLite temporaire par défaut) avec un foyer de N membres,
+puis compare, à travers l'API, N appels individuels à /dashboard/summary avec un
+appel à /households/{id}/summary, sans cache puis depuis le cache.
+
+    python -m benchmarks.household_summary --members 10
+"""
+import argparse
+import tempfile
+
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.core import database
+from app.core.cache import result_cache
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.crud.household import household_tag
+from app.main import app
+from app.models.household import Household, HouseholdMember
+from app.models.user import User
+from benchmarks.common import timed
+from benchmarks.forecast import seed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=10)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/household.db"
+    database.engine = create_engine(url)
+    SQLModel.metadata.create_all(database.engine)
+    settings.RATE_LIMIT_ENABLED = False
+    settings.HEAVY_ROUTE_MAX_CONCURRENCY = 1000
+
+    user_ids = seed(database.engine, args.members, args.days)
+    with Session(database.engine) as db:
+        household = Household(name="Benchmark", owner_id=user_ids[0])
+        db.add(household)
+        db.add_all(HouseholdMember(household_id=household.household_id, user_id=u, pending=False) for u in user_ids)
+        db.commit()
+        household_id = household.household_id
+        headers = [
+            {"Authorization": f"Bearer {create_access_token({'sub': db.get(User, u).email})}"}
+            for u in user_ids
+        ]
+
+    with TestClient(app) as client:
+        def individual_calls():
+            for member_headers in headers:
+                assert client.get("/api/v1/dashboard/summary?period=yearly", headers=member_headers).status_code == 200
+
+        def household_call(cold: bool):
+            if cold:
+                result_cache.invalidate(household_tag(household_id))
+            response = client.get(f"/api/v1/households/{household_id}/summary?period=yearly", headers=headers[0])
+            assert response.status_code == 200
+
+        print(f"foyer de {args.members} membres, {args.days} jours d'historique ({url})")
+        scenarios = [
+            (f"{args.members} x /dashboard/summary", individual_calls),
+            ("/households/summary (sans cache)", lambda: household_call(True)),
+            ("/households/summary (cache)", lambda: household_call(False)),
+        ]
+        for label, func in scenarios:
+            print(f"{label:<34}: {timed(func, args.repeat):8.2f} ms")
+
+if __name__ == "__main__":
+    main()
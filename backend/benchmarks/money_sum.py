@@ -0,0 +1,92 @@
+"""Benchmark des agrégations monétaires : flottants contre centimes entiers.
+
+Remplit une table de test avec les mêmes montants stockés en FLOAT et en BIGINT
+(centimes), puis compare l'écart de SUM() à la somme décimale exacte et le
+débit des agrégations (total et GROUP BY catégorie).
+
+    python -m benchmarks.money_sum --rows 1000000 --database-url sqlite:////tmp/money.db
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, Column, Float, Integer, MetaData, String, Table, create_engine, func, select
+
+from app.core.money import from_cents
+
+metadata = MetaData()
+ledger = Table(
+    "bench_ledger", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("category", String(20), nullable=False),
+    Column("amount", Float, nullable=False),
+    Column("amount_cents", BigInteger, nullable=False),
+)
+
+CATEGORIES = ["courses", "transport", "restaurant", "loisirs", "sante", "factures"]
+
+def seed(engine, rows: int, batch_size: int = 50000) -> Decimal:
+    """Insérer des montants à deux décimales ; retourne leur somme décimale exacte"""
+    rng = random.Random(3)
+    exact = Decimal(0)
+    with engine.begin() as conn:
+        for offset in range(0, rows, batch_size):
+            batch = []
+            for _ in range(min(batch_size, rows - offset)):
+                cents = rng.randint(1, 50000)
+                exact += Decimal(cents) / 100
+                batch.append({"category": rng.choice(CATEGORIES), "amount": cents / 100, "amount_cents": cents})
+            conn.execute(ledger.insert(), batch)
+    return exact
+
+def timed(conn, statement, repeat: int):
+    """Résultat et durée médiane d'une requête en millisecondes"""
+    samples, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = conn.execute(statement).all()
+        samples.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/money.db"
+    engine = create_engine(url)
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    started = time.perf_counter()
+    exact = seed(engine, args.rows)
+    print(f"{args.rows} montants insérés en {time.perf_counter() - started:.1f} s ({url})")
+
+    with engine.connect() as conn:
+        (float_total,), float_ms = timed(conn, select(func.sum(ledger.c.amount)), args.repeat)
+        (cents_total,), cents_ms = timed(conn, select(func.sum(ledger.c.amount_cents)), args.repeat)
+        float_groups, float_group_ms = timed(
+            conn, select(ledger.c.category, func.sum(ledger.c.amount)).group_by(ledger.c.category), args.repeat
+        )
+        cents_groups, cents_group_ms = timed(
+            conn, select(ledger.c.category, func.sum(ledger.c.amount_cents)).group_by(ledger.c.category), args.repeat
+        )
+
+    float_error = abs(Decimal(repr(float_total[0])) - exact)
+    cents_error = abs(Decimal(int(cents_total[0])) / 100 - exact)
+    print(f"somme exacte              : {exact}")
+    print(f"SUM(amount) flottant      : {float_total[0]!r} (écart {float_error}) en {float_ms:.1f} ms")
+    print(f"SUM(amount_cents)         : {from_cents(int(cents_total[0])):.2f} (écart {cents_error}) en {cents_ms:.1f} ms")
+    print(f"GROUP BY catégorie        : flottant {float_group_ms:.1f} ms, centimes {cents_group_ms:.1f} ms")
+    drift = sum(
+        1 for (_, f), (_, c) in zip(sorted(float_groups), sorted(cents_groups))
+        if Decimal(repr(f)) != Decimal(int(c)) / 100
+    )
+    print(f"catégories dont le total flottant n'est pas exact au centime : {drift}/{len(CATEGORIES)}")
+
+if __name__ == "__main__":
+    main()
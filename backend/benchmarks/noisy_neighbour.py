@@ -0,0 +1,146 @@
+"""Benchmark "voisin bruyant" : latence des utilisateurs normaux face à un client agressif.
+
+Démarre l'API (uvicorn, un worker) sur une base SQLite temporaire avec un petit
+pool de connexions. Dix utilisateurs réguliers appellent /dashboard/summary
+pendant qu'un client enchaîne les requêtes coûteuses (GET /transactions?limit=1000)
+depuis de nombreuses connexions, sans puis avec limitation de débit et délestage.
+
+    python -m benchmarks.noisy_neighbour --duration 5
+"""
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+import httpx
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from app.core import database
+from app.core.config import settings
+from app.core.security import verify_token
+from app.models.transaction import Transaction, TransactionCategory, TransactionType
+from app.models.user import User
+from benchmarks.common import free_port, percentile
+from benchmarks.sqlite_api import prepare_database, start_server
+
+POOL_SIZE = 3
+QUIET_USERS = 10
+QUIET_INTERVAL = 0.2  # 5 requêtes/s par utilisateur normal
+QUIET_ROUTE = "/api/v1/dashboard/summary"
+NOISY_CLIENTS = 16
+NOISY_ROUTE = "/api/v1/transactions/?limit=1000"
+NOISY_TRANSACTIONS = 5000
+
+def seed_noisy_user(headers: dict):
+    """Historique volumineux pour le client agressif (base préparée par prepare_database)"""
+    email = verify_token(headers["Authorization"].split()[1])
+    today = date.today()
+    with Session(database.get_engine()) as db:
+        user_id = db.exec(select(User.user_id).where(User.email == email)).one()
+        db.execute(insert(Transaction), [
+            {
+                "transaction_id": f"noisy-{index}",
+                "user_id": user_id,
+                "amount_cents": 100 + index,
+                "currency": settings.DEFAULT_CURRENCY,
+                "type": TransactionType.EXPENSE,
+                "category": TransactionCategory.GROCERIES,
+                "date": today - timedelta(days=index % 365),
+            }
+            for index in range(NOISY_TRANSACTIONS)
+        ])
+        db.commit()
+    database.dispose_engine()
+
+def run_load(port: int, quiet_headers: list, noisy_headers: dict, duration: float) -> dict:
+    """Utilisateurs réguliers et client agressif en parallèle"""
+    results = {"quiet": [], "quiet_errors": 0, "quiet_shed": 0, "noisy": {}}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def quiet_user(headers: dict):
+        latencies, errors, shed = [], 0, 0
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", headers=headers, timeout=60) as http:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = http.get(QUIET_ROUTE)
+                latencies.append(time.perf_counter() - started)
+                errors += response.status_code != 200
+                shed += response.status_code == 503
+                time.sleep(QUIET_INTERVAL)
+        with lock:
+            results["quiet"].extend(latencies)
+            results["quiet_errors"] += errors
+            results["quiet_shed"] += shed
+
+    def noisy_client():
+        statuses = {}
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", headers=noisy_headers, timeout=60) as http:
+            while time.perf_counter() < deadline:
+                status = http.get(NOISY_ROUTE).status_code
+                statuses[status] = statuses.get(status, 0) + 1
+        with lock:
+            for status, count in statuses.items():
+                results["noisy"][status] = results["noisy"].get(status, 0) + count
+
+    threads = [threading.Thread(target=quiet_user, args=(headers,)) for headers in quiet_headers]
+    threads += [threading.Thread(target=noisy_client) for _ in range(NOISY_CLIENTS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--rate-per-minute", type=int, default=600)
+    parser.add_argument("--burst", type=int, default=20)
+    args = parser.parse_args()
+
+    url = f"sqlite:///{tempfile.mkdtemp()}/noisy.db"
+    headers = prepare_database(url, QUIET_USERS + 1)
+    noisy_headers, quiet_headers = headers[0], headers[1:]
+    seed_noisy_user(noisy_headers)
+
+    common = {"DB_POOL_SIZE": str(POOL_SIZE), "DB_MAX_OVERFLOW": "0", "DB_POOL_WARMUP": str(POOL_SIZE)}
+    rate_limit = {
+        "RATE_LIMIT_ENABLED": "True",
+        "RATE_LIMIT_PER_MINUTE": str(args.rate_per_minute),
+        "RATE_LIMIT_BURST": str(args.burst),
+    }
+    scenarios = [
+        ("sans limitation", common),
+        ("token bucket", {**common, **rate_limit}),
+        ("token bucket + délestage", {
+            **common, **rate_limit, "HEAVY_ROUTE_MAX_CONCURRENCY": "8", "POOL_WAIT_SHED_THRESHOLD_MS": "250"
+        }),
+    ]
+    print(f"pool de {POOL_SIZE} connexions, {QUIET_USERS} utilisateurs réguliers, {NOISY_CLIENTS} connexions agressives")
+    print(f"{'scénario':<26}{'p50 (ms)':>10}{'p99 (ms)':>10}{'erreurs':>9}{'dont 503':>10}{'bruyant ok':>12}{'429':>7}{'503':>7}")
+    for name, overrides in scenarios:
+        port = free_port()
+        server = start_server(url, port, 1, overrides)
+        try:
+            results = run_load(port, quiet_headers, noisy_headers, args.duration)
+        finally:
+            server.terminate()
+            server.wait()
+        print(
+            f"{name:<26}"
+            f"{statistics.median(results['quiet']) * 1000:>10.1f}"
+            f"{percentile(results['quiet'], 99) * 1000:>10.1f}"
+            f"{results['quiet_errors']:>9}"
+            f"{results['quiet_shed']:>10}"
+            f"{results['noisy'].get(200, 0):>12}"
+            f"{results['noisy'].get(429, 0):>7}"
+            f"{results['noisy'].get(503, 0):>7}"
+        )
+        # Le délestage ne vise que les clients au-delà de leur part du pool
+        assert results["quiet_shed"] == 0, f"{name} : utilisateurs réguliers délestés"
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark de /dashboard/compare : une requête groupée contre N appels par période.
+
+Peuple une base dédiée (SQLite temporaire par défaut) avec plusieurs années
+d'historique pour un utilisateur, puis compare, à travers l'API, N appels à
+/dashboard/expenses-by-category (un par période) avec un appel à
+/dashboard/compare?periods=N, sans cache puis depuis le cache.
+
+    python -m benchmarks.period_comparison --periods 2 6 12
+"""
+import argparse
+import tempfile
+from datetime import date
+
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.core import database
+from app.core.cache import result_cache
+from app.core.config import settings
+from app.core.periods import comparison_bounds
+from app.core.security import create_access_token
+from app.main import app
+from app.models.user import User
+from benchmarks.common import timed
+from benchmarks.forecast import seed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--periods", type=int, nargs="+", default=[2, 6, 12])
+    parser.add_argument("--period", default="monthly", choices=["weekly", "monthly", "yearly"])
+    parser.add_argument("--days", type=int, default=3 * 365)
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/comparison.db"
+    database.engine = create_engine(url)
+    SQLModel.metadata.create_all(database.engine)
+    settings.RATE_LIMIT_ENABLED = False
+    settings.HEAVY_ROUTE_MAX_CONCURRENCY = 1000
+
+    user_id = seed(database.engine, 1, args.days)[0]
+    with Session(database.engine) as db:
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': db.get(User, user_id).email})}"}
+
+    with TestClient(app) as client:
+        print(f"{args.days} jours d'historique, période {args.period} ({url})")
+        for count in args.periods:
+            bounds = comparison_bounds(args.period, date.today(), count)
+
+            def single_period_calls():
+                for start, end in bounds:
+                    response = client.get(
+                        f"/api/v1/dashboard/expenses-by-category?start_date={start}&end_date={end}",
+                        headers=headers
+                    )
+                    assert response.status_code == 200
+
+            def comparison_call(cold: bool):
+                if cold:
+                    result_cache.invalidate(user_id)
+                response = client.get(
+                    f"/api/v1/dashboard/compare?period={args.period}&periods={count}", headers=headers
+                )
+                assert response.status_code == 200
+
+            scenarios = [
+                (f"{count} x /expenses-by-category", single_period_calls),
+                (f"/compare?periods={count} (sans cache)", lambda: comparison_call(True)),
+                (f"/compare?periods={count} (cache)", lambda: comparison_call(False)),
+            ]
+            for label, func in scenarios:
+                print(f"{label:<36}: {timed(func, args.repeat):8.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Benchmark de l'API complète en mode embarqué SQLite : débit lectures/écritures.
+
+Pour chaque scénario (WAL avec file d'écriture, WAL sans file, journal DELETE
+par défaut de SQLite), crée une base migrée (alembic upgrade head), démarre
+uvicorn avec plusieurs workers, puis des clients HTTP concurrents enchaînent
+lectures (GET /transactions, /dashboard/summary) et créations de transactions.
+Les erreurs (5xx ou connexion coupée) comptent notamment les "database is locked".
+
+    python -m benchmarks.sqlite_api --workers 4 --clients 32 --duration 10
+"""
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+import httpx
+from alembic import command
+from alembic.config import Config
+from sqlmodel import Session
+
+from app.core import database
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.user import User
+from benchmarks.common import free_port, percentile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = [
+    ("WAL + file d'écriture", {"SQLITE_JOURNAL_MODE": "WAL", "SQLITE_WRITE_QUEUE": "True"}),
+    ("WAL sans file", {"SQLITE_JOURNAL_MODE": "WAL", "SQLITE_WRITE_QUEUE": "False"}),
+    ("journal DELETE", {"SQLITE_JOURNAL_MODE": "DELETE", "SQLITE_SYNCHRONOUS": "FULL", "SQLITE_WRITE_QUEUE": "False"}),
+]
+
+READS = ["/api/v1/transactions/?limit=50", "/api/v1/dashboard/summary"]
+
+def prepare_database(url: str, users: int) -> list:
+    """Migrer une base neuve et créer les utilisateurs ; retourne leurs en-têtes d'authentification"""
+    settings.DATABASE_URL = url
+    settings.DEBUG = False
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    command.upgrade(config, "head")
+
+    database.dispose_engine()
+    emails = [f"{uuid.uuid4()}@bench.local" for _ in range(users)]
+    with Session(database.get_engine()) as db:
+        db.add_all(User(email=email, hashed_password="x") for email in emails)
+        db.commit()
+    database.dispose_engine()
+    return [{"Authorization": f"Bearer {create_access_token({'sub': email})}"} for email in emails]
+
+def start_server(url: str, port: int, workers: int, overrides: dict) -> subprocess.Popen:
+    """Démarrer uvicorn sur la base du scénario et attendre /health"""
+    env = dict(
+        os.environ,
+        DATABASE_URL=url,
+        DEBUG="False",
+        RATE_LIMIT_ENABLED="False",
+        HEAVY_ROUTE_MAX_CONCURRENCY="10000",
+        POOL_WAIT_SHED_THRESHOLD_MS="1e9"
+    )
+    env.update(overrides)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env
+    )
+    deadline = time.perf_counter() + 30
+    while time.perf_counter() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return server
+        except httpx.TransportError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("uvicorn n'a pas démarré")
+
+def run_load(port: int, headers: list, clients: int, duration: float, write_ratio: float) -> dict:
+    """Clients concurrents : chaque requête est une écriture avec la probabilité write_ratio"""
+    results = {"read": [], "write": [], "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(index: int):
+        rng = random.Random(index)
+        user_headers = headers[index % len(headers)]
+        latencies = {"read": [], "write": []}
+        errors = 0
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", headers=user_headers, timeout=30) as http:
+            while time.perf_counter() < deadline:
+                kind = "write" if rng.random() < write_ratio else "read"
+                started = time.perf_counter()
+                try:
+                    if kind == "write":
+                        response = http.post("/api/v1/transactions/", json={
+                            "amount": round(rng.uniform(1, 200), 2), "type": "expense", "category": "courses"
+                        })
+                    else:
+                        response = http.get(rng.choice(READS))
+                except httpx.TransportError:
+                    errors += 1
+                    continue
+                latencies[kind].append(time.perf_counter() - started)
+                errors += response.status_code >= 500
+        with lock:
+            results["read"].extend(latencies["read"])
+            results["write"].extend(latencies["write"])
+            results["errors"] += errors
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--users", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    args = parser.parse_args()
+
+    print(f"{args.workers} workers uvicorn, {args.clients} clients, {args.write_ratio:.0%} d'écritures, {args.duration:.0f} s")
+    print(f"{'scénario':<24}{'lect./s':>9}{'écr./s':>9}{'p99 lect. ms':>14}{'p99 écr. ms':>13}{'erreurs':>13}")
+    for name, overrides in SCENARIOS:
+        url = f"sqlite:///{tempfile.mkdtemp()}/budget.db"
+        headers = prepare_database(url, args.users)
+        port = free_port()
+        server = start_server(url, port, args.workers, overrides)
+        try:
+            results = run_load(port, headers, args.clients, args.duration, args.write_ratio)
+        finally:
+            server.terminate()
+            server.wait()
+        print(
+            f"{name:<24}"
+            f"{len(results['read']) / args.duration:>9.0f}"
+            f"{len(results['write']) / args.duration:>9.0f}"
+            f"{percentile(results['read'], 99) * 1000:>14.1f}"
+            f"{percentile(results['write'], 99) * 1000:>13.1f}"
+            f"{results['errors']:>13}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark de démarrage à froid : temps d'import et délai avant le premier /health.
+
+Mesure le temps d'import cumulé de app.main (python -X importtime), liste les
+modules les plus coûteux, puis lance uvicorn et chronomètre la première réponse
+200 de /health. Avec des budgets, sert de contrôle de régression (code de sortie 1).
+
+    python -m benchmarks.startup --max-import-ms 1500 --max-ready-ms 4000
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+from benchmarks.common import free_port
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def measure_imports(module: str):
+    """Retourner (temps cumulé du module en ms, [(cumulé ms, import direct du module)])"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            entries.append((len(match.group(3)), int(match.group(2)) / 1000, match.group(4)))
+    indent, total = next((depth, ms) for depth, ms, name in entries if name == module)
+    # Les imports directs sont indentés d'un niveau (2 espaces) de plus que le module
+    children = sorted(
+        ((ms, name) for depth, ms, name in entries if depth == indent + 2),
+        reverse=True
+    )
+    return total, children
+
+def measure_ready(timeout: float) -> float:
+    """Lancer uvicorn et retourner le délai (ms) jusqu'au premier /health réussi"""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env={**os.environ, "DEBUG": "False"}
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError("uvicorn exited before becoming healthy")
+            try:
+                with urllib.request.urlopen(url, timeout=0.5) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise RuntimeError(f"/health not ready after {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-ready-ms", type=float, default=None)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    import_ms, top_level = measure_imports(args.module)
+    print(f"import {args.module}: {import_ms:.0f} ms")
+    for cumulative_ms, name in top_level[:args.top]:
+        print(f"  {cumulative_ms:>8.1f} ms  {name}")
+
+    ready_ms = measure_ready(args.timeout)
+    print(f"premier /health: {ready_ms:.0f} ms")
+
+    failures = []
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        failures.append(f"import {import_ms:.0f} ms > budget {args.max_import_ms:.0f} ms")
+    if args.max_ready_ms is not None and ready_ms > args.max_ready_ms:
+        failures.append(f"/health {ready_ms:.0f} ms > budget {args.max_ready_ms:.0f} ms")
+    for failure in failures:
+        print(f"ÉCHEC : {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
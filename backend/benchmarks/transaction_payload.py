@@ -0,0 +1,107 @@
+"""Benchmark des formats de réponse de GET /transactions pour une page de 1000 lignes.
+
+Compare le format actuel (TransactionResponse complet), la projection fields=
+(amount,category,date) et le format colonnaire : octets transférés (brut, gzip,
+brotli si installé) et temps CPU serveur de sérialisation + compression.
+
+    python -m benchmarks.transaction_payload --rows 1000
+"""
+import argparse
+import gzip
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.money import from_cents
+from app.models.transaction import TransactionCategory, TransactionResponse, TransactionType
+from app.routers.transactions import serialize_columns, serialize_rows
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+LIST_FIELDS = ["amount", "category", "date"]
+
+def make_transactions(count: int):
+    """Générer des transactions réalistes pour un même utilisateur"""
+    rng = random.Random(42)
+    user_id = str(uuid.uuid4())
+    today = date.today()
+    categories = list(TransactionCategory)
+    return [
+        {
+            "transaction_id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "amount_cents": rng.randint(100, 50000),
+            "currency": "EUR",
+            "type": rng.choice(list(TransactionType)),
+            "category": rng.choice(categories),
+            "description": rng.choice([None, "Supermarché", "Abonnement mensuel", "Remboursement"]),
+            "date": today - timedelta(days=rng.randrange(365)),
+            "created_at": datetime.utcnow(),
+        }
+        for _ in range(count)
+    ]
+
+def encode_full(transactions):
+    """Format actuel : modèles de réponse complets sérialisés par FastAPI"""
+    models = [
+        TransactionResponse(**{k: v for k, v in t.items() if k != "amount_cents"}, amount=from_cents(t["amount_cents"]))
+        for t in transactions
+    ]
+    return JSONResponse(jsonable_encoder(models)).body
+
+def encode_sparse(transactions):
+    """fields=amount,category,date : lignes projetées par le SELECT"""
+    rows = [(t["amount_cents"], t["category"], t["date"]) for t in transactions]
+    return JSONResponse(serialize_rows(LIST_FIELDS, rows)).body
+
+def encode_columnar(transactions):
+    """format=columnar avec les mêmes champs"""
+    rows = [(t["amount_cents"], t["category"], t["date"]) for t in transactions]
+    data = serialize_columns(LIST_FIELDS, rows)
+    return JSONResponse({"count": len(rows), "fields": LIST_FIELDS, "data": data}).body
+
+def cpu_ms(func, repeat: int) -> float:
+    """Temps CPU moyen d'un appel en millisecondes"""
+    started = time.process_time()
+    for _ in range(repeat):
+        func()
+    return (time.process_time() - started) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    transactions = make_transactions(args.rows)
+    encoders = [
+        ("actuel (complet)", encode_full),
+        ("fields=3 champs", encode_sparse),
+        ("colonnaire", encode_columnar),
+    ]
+    codecs = [("gzip", lambda body: gzip.compress(body, compresslevel=6))]
+    if brotli is not None:
+        codecs.append(("brotli", lambda body: brotli.compress(body, quality=4)))
+
+    header = f"{'format':<18}{'brut (o)':>10}{'json ms':>9}"
+    for name, _ in codecs:
+        header += f"{name + ' (o)':>14}{name + ' ms':>11}"
+    print(header)
+    for name, encode in encoders:
+        body = encode(transactions)
+        line = f"{name:<18}{len(body):>10}{cpu_ms(lambda: encode(transactions), args.repeat):>9.2f}"
+        for _, compress in codecs:
+            line += f"{len(compress(body)):>14}{cpu_ms(lambda: compress(body), args.repeat):>11.2f}"
+        print(line)
+    if brotli is None:
+        print("(brotli non installé : pip install -r requirements-optional.txt)")
+
+if __name__ == "__main__":
+    main()
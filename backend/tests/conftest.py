@@ -0,0 +1,60 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, Session
+
+from app.core import database
+from app.core.cache import result_cache
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.user import User
+
+def pytest_addoption(parser):
+    parser.addoption("--run-slow", action="store_true", help="Exécuter aussi les tests marqués slow")
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: test long, exécuté seulement avec --run-slow")
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="test long : utiliser --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Base SQLite dédiée au test, branchée comme moteur de l'application"""
+    monkeypatch.setattr(settings, "DEBUG", False)
+    test_engine = database.create_sqlite_engine(f"sqlite:///{tmp_path}/test.db")
+    SQLModel.metadata.create_all(test_engine)
+    database.engine = test_engine
+    result_cache.clear()
+    yield test_engine
+    database.engine = None
+    test_engine.dispose()
+    result_cache.clear()
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as session:
+        yield session
+
+@pytest.fixture
+def client(engine, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", False)
+    from app.main import app
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture
+def make_user(engine):
+    """Créer un utilisateur ; retourne (user_id, en-têtes d'authentification)"""
+    def factory(email: str):
+        with Session(engine) as session:
+            user = User(email=email, hashed_password="x")
+            session.add(user)
+            session.commit()
+            user_id = user.user_id
+        return user_id, {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+    return factory
@@ -0,0 +1,161 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app import dependencies
+from app.core import rate_limit
+from app.core.config import settings
+from app.core.database import pool_monitor
+from app.core.rate_limit import ConcurrencyLimiter, InFlightTracker, TokenBucketLimiter
+from app.dependencies import RouteConcurrencyLimit
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    return now
+
+@pytest.fixture
+def checkouts(engine):
+    """Nombre de connexions prises dans le pool"""
+    count = [0]
+    def on_checkout(*args):
+        count[0] += 1
+    event.listen(engine, "checkout", on_checkout)
+    yield count
+    event.remove(engine, "checkout", on_checkout)
+
+def test_token_bucket_allows_burst_then_refills(clock):
+    limiter = TokenBucketLimiter(rate_per_minute=60, burst=2)
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") == pytest.approx(1.0)
+    assert limiter.acquire("b") == 0
+    clock[0] += 1.0
+    assert limiter.acquire("a") == 0
+
+def test_token_bucket_prunes_idle_buckets(clock, monkeypatch):
+    monkeypatch.setattr(TokenBucketLimiter, "MAX_BUCKETS", 2)
+    limiter = TokenBucketLimiter(rate_per_minute=60, burst=1)
+    limiter.acquire("a")
+    clock[0] += 10
+    limiter.acquire("b")
+    limiter.acquire("c")
+    assert set(limiter._buckets) == {"b", "c"}
+
+def test_rate_limit_rejects_before_opening_a_session(client, make_user, checkouts, monkeypatch):
+    _, headers = make_user("busy@test.local")
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(dependencies, "rate_limiter", TokenBucketLimiter(rate_per_minute=1, burst=2))
+
+    for _ in range(2):
+        assert client.get("/api/v1/transactions/", headers=headers).status_code == 200
+    before = checkouts[0]
+    response = client.get("/api/v1/transactions/", headers=headers)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert checkouts[0] == before
+
+    _, other_headers = make_user("calm@test.local")
+    assert client.get("/api/v1/transactions/", headers=other_headers).status_code == 200
+
+def test_invalid_token_is_rejected_by_authentication(client, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    response = client.get("/api/v1/transactions/", headers={"Authorization": "Bearer invalid"})
+    assert response.status_code == 401
+
+def test_shedding_only_rejects_users_above_their_fair_share(client, make_user, checkouts, monkeypatch):
+    _, noisy = make_user("noisy@test.local")
+    _, quiet = make_user("quiet@test.local")
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 2)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(pool_monitor, "_ewma", 0.0)
+    pool_monitor.record(10.0)
+    # Le client bruyant a déjà plus de requêtes en cours que le pool n'a de connexions
+    for _ in range(3):
+        dependencies.in_flight.acquire("noisy@test.local")
+    try:
+        before = checkouts[0]
+        response = client.get("/api/v1/dashboard/balance", headers=noisy)
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == str(settings.SHED_RETRY_AFTER_SECONDS)
+        assert checkouts[0] == before
+        # Les autres utilisateurs ne sont pas délestés
+        for _ in range(3):
+            assert client.get("/api/v1/dashboard/balance", headers=quiet).status_code == 200
+    finally:
+        for _ in range(3):
+            dependencies.in_flight.release("noisy@test.local")
+    assert dependencies.in_flight.count("quiet@test.local") == 0
+    assert client.get("/api/v1/dashboard/balance", headers=noisy).status_code == 200
+
+def test_fair_share_splits_capacity_between_active_users():
+    tracker = InFlightTracker()
+    assert tracker.fair_share(6) == 6
+    for key in ("a", "a", "b"):
+        tracker.acquire(key)
+    assert tracker.fair_share(6) == 3
+    assert tracker.fair_share(1) == 1
+    assert tracker.above_share("a", 2) and not tracker.above_share("b", 2)
+    tracker.release("a")
+    tracker.release("a")
+    assert tracker.count("a") == 0 and tracker.fair_share(6) == 6
+
+def test_concurrency_limiter_caps_in_flight_requests():
+    limiter = ConcurrencyLimiter(2)
+    assert limiter.try_acquire() and limiter.try_acquire()
+    assert not limiter.try_acquire()
+    limiter.release()
+    assert limiter.try_acquire()
+
+def test_concurrency_limiter_only_rejects_clients_above_their_share():
+    limiter = ConcurrencyLimiter(4)
+    for _ in range(5):
+        assert limiter.try_acquire("noisy")
+    assert not limiter.try_acquire("noisy")
+    # Route pleine, mais les autres clients sont sous leur part
+    assert limiter.try_acquire("quiet-1")
+    assert limiter.try_acquire("quiet-2")
+    assert limiter.try_acquire("quiet-2")
+    assert not limiter.try_acquire("quiet-2")
+    limiter.release("noisy")
+    assert not limiter.try_acquire("noisy")
+
+def test_route_concurrency_limit_rejects_beyond_cap(make_user):
+    _, headers = make_user("route@test.local")
+    token = headers["Authorization"].split()[1]
+
+    async def scenario():
+        limit = RouteConcurrencyLimit(1)
+        held = [limit(token), limit(token)]
+        for dependency in held:
+            await dependency.__anext__()
+        with pytest.raises(HTTPException) as rejected:
+            await limit(token).__anext__()
+        assert rejected.value.status_code == 503
+        # Sans sujet identifiable, la limite est stricte
+        with pytest.raises(HTTPException):
+            await limit("invalid").__anext__()
+        for dependency in held:
+            await dependency.aclose()
+        again = limit(token)
+        await again.__anext__()
+        await again.aclose()
+    asyncio.run(scenario())
+
+def test_route_concurrency_limit_follows_the_setting(make_user, monkeypatch):
+    _, headers = make_user("setting@test.local")
+    token = headers["Authorization"].split()[1]
+    limit = RouteConcurrencyLimit()
+    monkeypatch.setattr(settings, "HEAVY_ROUTE_MAX_CONCURRENCY", 1000)
+
+    async def scenario():
+        held = [limit(token) for _ in range(20)]
+        for dependency in held:
+            await dependency.__anext__()
+        for dependency in held:
+            await dependency.aclose()
+    asyncio.run(scenario())
+    assert limit.limiter.limit == 1000
@@ -0,0 +1,141 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, select, func
+
+from app.crud.alert import create_alert, get_alerts, prune_read_alerts
+from app.jobs import alert_retention
+from app.models.alert import Alert, AlertCreate, AlertType
+from app.models.user import User
+
+URL = "/api/v1/alerts/"
+
+def add_alerts(engine, user_id: str, count: int, is_read: bool = False, age_days: int = 0) -> list:
+    """Créer des alertes (via create_alert) et les vieillir si demandé"""
+    ids = []
+    with Session(engine) as db:
+        for index in range(count):
+            alert = create_alert(db, AlertCreate(
+                message=f"alerte {index}", alert_type=AlertType.BUDGET_WARNING, category="courses", is_read=is_read
+            ), user_id)
+            if age_days:
+                alert.created_at = datetime.utcnow() - timedelta(days=age_days)
+                db.add(alert)
+                db.commit()
+            ids.append(alert.alert_id)
+    return ids
+
+def assert_counter_in_sync(engine, user_id: str):
+    with Session(engine) as db:
+        unread = db.exec(
+            select(func.count()).select_from(Alert).where(Alert.user_id == user_id, Alert.is_read == False)  # noqa: E712
+        ).one()
+        assert db.get(User, user_id).unread_alert_count == unread
+    return unread
+
+def unread_count(client, headers) -> int:
+    return client.get(f"{URL}unread-count", headers=headers).json()["unread_count"]
+
+def test_unread_counter_follows_create_read_and_read_all(client, engine, make_user):
+    user_id, headers = make_user("alerts@test.local")
+    ids = add_alerts(engine, user_id, 3)
+    add_alerts(engine, user_id, 1, is_read=True)
+    assert unread_count(client, headers) == 3 == assert_counter_in_sync(engine, user_id)
+
+    # Marquer deux fois la même alerte ne décrémente qu'une fois
+    for _ in range(2):
+        response = client.post(f"{URL}{ids[0]}/read", headers=headers)
+        assert response.status_code == 200 and response.json()["is_read"]
+    assert unread_count(client, headers) == 2 == assert_counter_in_sync(engine, user_id)
+
+    assert client.post(f"{URL}unknown/read", headers=headers).status_code == 404
+    unread = client.get(URL, params={"unread_only": True}, headers=headers).json()
+    assert sorted(alert["alert_id"] for alert in unread) == sorted(ids[1:])
+
+    body = client.post(f"{URL}read-all", headers=headers).json()
+    assert body["updated"] == 2
+    assert unread_count(client, headers) == 0 == assert_counter_in_sync(engine, user_id)
+    assert client.post(f"{URL}read-all", headers=headers).json()["updated"] == 0
+    assert len(client.get(URL, headers=headers).json()) == 4
+
+def test_read_all_only_touches_the_current_user(client, engine, make_user):
+    user_id, headers = make_user("mine@test.local")
+    other_id, other_headers = make_user("other@test.local")
+    add_alerts(engine, user_id, 2)
+    other_ids = add_alerts(engine, other_id, 2)
+    client.post(f"{URL}read-all", headers=headers)
+    assert client.post(f"{URL}{other_ids[0]}/read", headers=headers).status_code == 404
+    assert unread_count(client, other_headers) == 2 == assert_counter_in_sync(engine, other_id)
+
+def test_prune_only_deletes_old_read_alerts(engine, make_user):
+    user_id, _ = make_user("prune@test.local")
+    old_read = add_alerts(engine, user_id, 3, is_read=True, age_days=120)
+    old_unread = add_alerts(engine, user_id, 2, age_days=120)
+    recent_read = add_alerts(engine, user_id, 2, is_read=True)
+    cutoff = datetime.utcnow() - timedelta(days=90)
+
+    with Session(engine) as db:
+        assert prune_read_alerts(db, cutoff, batch_size=2) == 2
+        assert prune_read_alerts(db, cutoff, batch_size=2) == 1
+        assert prune_read_alerts(db, cutoff, batch_size=2) == 0
+        remaining = set(db.exec(select(Alert.alert_id)).all())
+    assert remaining == set(old_unread + recent_read)
+    assert not remaining & set(old_read)
+    assert assert_counter_in_sync(engine, user_id) == 2
+
+def test_retention_job_deletes_in_batches_and_stops(engine, make_user, monkeypatch):
+    user_id, _ = make_user("retention@test.local")
+    add_alerts(engine, user_id, 7, is_read=True, age_days=120)
+    add_alerts(engine, user_id, 1, age_days=120)
+    pauses = []
+    monkeypatch.setattr(alert_retention.time, "sleep", pauses.append)
+
+    assert alert_retention.run(days=90, batch_size=3, pause=0.5) == 7
+    # Lots de 3, 3 puis 1 : une pause entre deux lots pleins, arrêt au lot incomplet
+    assert pauses == [0.5, 0.5]
+    assert alert_retention.run(days=90, batch_size=3, pause=0.5) == 0
+    assert pauses == [0.5, 0.5]
+    assert assert_counter_in_sync(engine, user_id) == 1
+
+@pytest.mark.parametrize("batch_size", [1, 7])
+def test_retention_job_stops_on_exact_multiple(engine, make_user, monkeypatch, batch_size):
+    user_id, _ = make_user(f"exact{batch_size}@test.local")
+    add_alerts(engine, user_id, 7, is_read=True, age_days=120)
+    monkeypatch.setattr(alert_retention.time, "sleep", lambda seconds: None)
+    assert alert_retention.run(days=90, batch_size=batch_size, pause=0) == 7
+
+def query_plan(engine, run) -> str:
+    """Plan SQLite de la requête SELECT émise par run(db)"""
+    captured = []
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with Session(engine) as db:
+            run(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    statement, parameters = captured[-1]
+    with engine.connect() as conn:
+        return " ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters))
+
+def test_each_inbox_query_uses_its_index(engine, make_user):
+    user_id, _ = make_user("plans@test.local")
+    other_id, _ = make_user("plans-other@test.local")
+    with Session(engine) as db:
+        db.add_all(
+            Alert(message="m", alert_type=AlertType.BUDGET_WARNING, category="c", is_read=index % 10 != 0,
+                  user_id=user_id if index % 2 else other_id,
+                  created_at=datetime.utcnow() - timedelta(minutes=index))
+            for index in range(2000)
+        )
+        db.commit()
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
+
+    unread = query_plan(engine, lambda db: get_alerts(db, user_id, unread_only=True))
+    assert "ix_alert_user_unread" in unread and "TEMP B-TREE" not in unread
+    everything = query_plan(engine, lambda db: get_alerts(db, user_id))
+    assert "ix_alert_user_created" in everything and "TEMP B-TREE" not in everything
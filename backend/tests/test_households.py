@@ -0,0 +1,65 @@
+import pytest
+
+URL = "/api/v1/households/"
+
+@pytest.fixture
+def household(client, make_user):
+    """Foyer du propriétaire et invitation envoyée à un autre utilisateur avec un revenu"""
+    owner_id, owner = make_user("owner@test.local")
+    invitee_id, invitee = make_user("invitee@test.local")
+    assert client.post("/api/v1/transactions/", json={
+        "amount": 4321.5, "type": "income", "category": "salaire"
+    }, headers=invitee).status_code == 200
+    assert client.post("/api/v1/transactions/", json={
+        "amount": 12.3, "type": "expense", "category": "courses"
+    }, headers=owner).status_code == 200
+
+    household_id = client.post(URL, json={"name": "home"}, headers=owner).json()["household_id"]
+    invited = client.post(f"{URL}{household_id}/members", json={"email": "invitee@test.local"}, headers=owner)
+    assert invited.status_code == 200
+    assert invited.json()["member_ids"] == [owner_id]
+    assert invited.json()["pending_member_ids"] == [invitee_id]
+    return {"id": household_id, "owner": owner, "invitee": invitee, "invitee_id": invitee_id}
+
+def summary(client, household, headers):
+    return client.get(f"{URL}{household['id']}/summary", headers=headers)
+
+def test_pending_member_data_is_never_shared(client, household):
+    # Avant et après une écriture de l'invité (le cache ne doit pas l'intégrer non plus)
+    for amount in (None, 99.0):
+        if amount:
+            client.post("/api/v1/transactions/", json={
+                "amount": amount, "type": "income", "category": "freelance"
+            }, headers=household["invitee"])
+        body = summary(client, household, household["owner"]).json()
+        assert body["balance"] == {"total_income": 0.0, "total_expenses": 12.3, "balance": -12.3}
+        assert household["invitee_id"] not in [member["user_id"] for member in body["members"]]
+
+def test_pending_member_cannot_read_the_household(client, household):
+    assert summary(client, household, household["invitee"]).status_code == 404
+    assert client.get(URL, headers=household["invitee"]).json() == []
+    invitations = client.get(f"{URL}invitations", headers=household["invitee"]).json()
+    assert [invitation["household_id"] for invitation in invitations] == [household["id"]]
+
+def test_accepted_member_is_included(client, household):
+    # Résumé mis en cache avant l'acceptation
+    assert summary(client, household, household["owner"]).json()["balance"]["total_income"] == 0.0
+    accepted = client.post(f"{URL}{household['id']}/accept", headers=household["invitee"])
+    assert accepted.status_code == 200
+    assert accepted.json()["pending_member_ids"] == []
+    body = summary(client, household, household["owner"]).json()
+    assert body["balance"]["total_income"] == 4321.5
+    assert summary(client, household, household["invitee"]).status_code == 200
+    assert client.post(f"{URL}{household['id']}/accept", headers=household["invitee"]).status_code == 404
+
+def test_declined_invitation_is_removed(client, household):
+    declined = client.delete(f"{URL}{household['id']}/members/{household['invitee_id']}", headers=household["invitee"])
+    assert declined.status_code == 200
+    assert client.get(f"{URL}invitations", headers=household["invitee"]).json() == []
+    assert client.post(f"{URL}{household['id']}/accept", headers=household["invitee"]).status_code == 404
+
+def test_only_the_owner_can_invite(client, household, make_user):
+    client.post(f"{URL}{household['id']}/accept", headers=household["invitee"])
+    make_user("third@test.local")
+    response = client.post(f"{URL}{household['id']}/members", json={"email": "third@test.local"}, headers=household["invitee"])
+    assert response.status_code == 403
@@ -0,0 +1,59 @@
+from decimal import Decimal
+
+import pytest
+
+from app.core.config import settings
+from app.core.money import from_cents, to_api_amounts, to_cents
+
+def test_to_cents_is_exact_for_binary_floats():
+    assert to_cents(0.1 + 0.2) == 30
+    assert to_cents(0.1) + to_cents(0.2) == to_cents(0.3)
+    assert to_cents("19.99") == 1999
+    assert to_cents(Decimal("1234567.89")) == 123456789
+
+@pytest.mark.parametrize("amount, cents", [
+    ("0.005", 1), ("0.015", 2), ("2.675", 268), (2.675, 268), ("-0.005", -1), ("0.004", 0),
+])
+def test_to_cents_rounds_half_up(amount, cents):
+    assert to_cents(amount) == cents
+
+@pytest.mark.parametrize("amount", [float("inf"), float("-inf"), float("nan"), "Infinity", "NaN"])
+def test_to_cents_rejects_non_finite(amount):
+    with pytest.raises(ValueError):
+        to_cents(amount)
+
+def test_to_cents_rejects_amounts_beyond_bigint():
+    with pytest.raises(ValueError):
+        to_cents(1e300)
+
+def test_minor_units_follow_currency():
+    assert to_cents(1234, "JPY") == 1234
+    assert to_cents("1.2345", "KWD") == 1235
+    assert from_cents(1235, "KWD") == 1.235
+    assert from_cents(1999) == 19.99
+
+def test_to_api_amounts_renames_cents_keys():
+    payload = {"balance_cents": 12345, "items": [{"amount_cents": 5, "change_pct": None}], "delta_cents": None}
+    assert to_api_amounts(payload) == {"balance": 123.45, "items": [{"amount": 0.05, "change_pct": None}], "delta": None}
+
+def test_create_transaction_rejects_non_finite_and_foreign_amounts(client, make_user):
+    _, headers = make_user("a@test.local")
+    body = '{"amount": %s, "type": "expense", "category": "courses"}'
+    for amount in ("Infinity", "NaN", "1e300"):
+        response = client.post("/api/v1/transactions/", content=body % amount, headers={**headers, "Content-Type": "application/json"})
+        assert response.status_code == 422, amount
+
+    foreign = "USD" if settings.DEFAULT_CURRENCY != "USD" else "EUR"
+    response = client.post("/api/v1/transactions/", json={
+        "amount": 5, "currency": foreign, "type": "expense", "category": "courses"
+    }, headers=headers)
+    assert response.status_code == 422
+
+def test_balance_sums_cents_exactly_through_the_api(client, make_user):
+    _, headers = make_user("b@test.local")
+    for amount in (0.1, 0.2):
+        assert client.post("/api/v1/transactions/", json={
+            "amount": amount, "type": "expense", "category": "courses"
+        }, headers=headers).status_code == 200
+    balance = client.get("/api/v1/dashboard/balance", headers=headers).json()
+    assert balance["total_expenses"] == 0.3
@@ -0,0 +1,63 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert
+
+from app.core.money import to_cents
+from app.crud.transaction import get_balance, get_expenses_by_category
+from app.models.transaction import Transaction, TransactionCategory, TransactionType
+
+ROWS = 1_000_000
+BATCH_SIZE = 50_000
+EXPENSE_CATEGORIES = [
+    TransactionCategory.GROCERIES, TransactionCategory.TRANSPORT, TransactionCategory.RESTAURANT,
+    TransactionCategory.HEALTHCARE, TransactionCategory.UTILITIES,
+]
+
+@pytest.mark.slow
+def test_aggregations_are_exact_over_a_million_rows(db, make_user):
+    user_id, _ = make_user("exact@test.local")
+    rng = random.Random(11)
+    today = date.today()
+    expected_income = Decimal(0)
+    expected_expenses = Decimal(0)
+    expected_by_category = {category: Decimal(0) for category in EXPENSE_CATEGORIES}
+
+    for offset in range(0, ROWS, BATCH_SIZE):
+        rows = []
+        for _ in range(BATCH_SIZE):
+            # Montants à deux décimales saisis comme des flottants, comme via l'API
+            amount = round(rng.uniform(0.01, 999.99), 2)
+            exact = Decimal(str(amount))
+            if rng.random() < 0.1:
+                transaction_type, category = TransactionType.INCOME, TransactionCategory.SALARY
+                expected_income += exact
+            else:
+                transaction_type, category = TransactionType.EXPENSE, rng.choice(EXPENSE_CATEGORIES)
+                expected_expenses += exact
+                expected_by_category[category] += exact
+            rows.append({
+                "transaction_id": f"{offset}-{len(rows)}",
+                "user_id": user_id,
+                "amount_cents": to_cents(amount),  # conversion de l'API
+                "currency": "EUR",
+                "type": transaction_type,
+                "category": category,
+                "date": today - timedelta(days=rng.randrange(365)),
+            })
+        db.execute(insert(Transaction), rows)
+    db.commit()
+
+    start, end = today - timedelta(days=365), today
+    balance = get_balance(db, user_id, start, end)
+    assert Decimal(balance["total_income_cents"]) / 100 == expected_income
+    assert Decimal(balance["total_expenses_cents"]) / 100 == expected_expenses
+    assert Decimal(balance["balance_cents"]) / 100 == expected_income - expected_expenses
+
+    by_category = {
+        item["category"]: Decimal(item["amount_cents"]) / 100
+        for item in get_expenses_by_category(db, user_id, start, end)
+    }
+    assert by_category == expected_by_category
@@ -0,0 +1,96 @@
+import subprocess
+import sys
+from datetime import date
+
+import pytest
+from sqlmodel import Session
+
+from app.core.cache import result_cache
+from app.crud import forecast as forecast_crud
+from app.crud.forecast import get_forecast
+from app.crud.household import create_household, add_member, accept_invitation, get_cached_household_summary
+from app.crud.transaction import create_transaction, delete_transaction, get_period_comparison
+from app.jobs import forecast_batch
+from app.models.forecast import ForecastGranularity
+from app.models.household import HouseholdCreate
+from app.models.transaction import TransactionCreate, TransactionCategory, TransactionType
+from app.models.user import User
+
+def expense(amount: float) -> TransactionCreate:
+    return TransactionCreate(amount=amount, type=TransactionType.EXPENSE, category=TransactionCategory.GROCERIES)
+
+@pytest.fixture
+def other_worker(monkeypatch):
+    """Écritures faites par un autre worker : le cache local n'est pas invalidé"""
+    monkeypatch.setattr(result_cache, "invalidate", lambda tag: None)
+
+def test_writes_bump_the_data_version(engine, make_user):
+    user_id, _ = make_user("version@test.local")
+    with Session(engine) as db:
+        transaction = create_transaction(db, expense(10), user_id)
+        delete_transaction(db, transaction.transaction_id, user_id)
+    with Session(engine) as db:
+        assert db.get(User, user_id).data_version == 2
+
+def test_comparison_sees_writes_from_another_worker(engine, make_user, other_worker):
+    user_id, _ = make_user("compare@test.local")
+    with Session(engine) as db:
+        create_transaction(db, expense(10), user_id)
+    with Session(engine) as db:
+        first = get_period_comparison(db, user_id, "monthly", 2)
+    with Session(engine) as db:
+        create_transaction(db, expense(5), user_id)
+    with Session(engine) as db:
+        second = get_period_comparison(db, user_id, "monthly", 2)
+    assert first["periods"][0]["total_expenses_cents"] == 1000
+    assert second["periods"][0]["total_expenses_cents"] == 1500
+
+def test_household_summary_sees_members_and_writes_from_another_worker(engine, make_user, other_worker):
+    owner_id, _ = make_user("owner@test.local")
+    member_id, _ = make_user("member@test.local")
+    today = date.today()
+    with Session(engine) as db:
+        household_id = create_household(db, HouseholdCreate(name="home"), owner_id).household_id
+        create_transaction(db, expense(10), owner_id)
+        assert get_cached_household_summary(db, household_id, today, today)["balance"]["total_expenses_cents"] == 1000
+    with Session(engine) as db:
+        add_member(db, household_id, member_id)
+        accept_invitation(db, household_id, member_id)
+        create_transaction(db, expense(7), member_id)
+    with Session(engine) as db:
+        summary = get_cached_household_summary(db, household_id, today, today)
+    assert summary["balance"]["total_expenses_cents"] == 1700
+    assert [member["user_id"] for member in summary["members"]] == [owner_id, member_id]
+
+def test_forecast_serves_a_fresh_snapshot_and_recomputes_after_a_write(engine, make_user, monkeypatch):
+    user_id, _ = make_user("forecast@test.local")
+    with Session(engine) as db:
+        create_transaction(db, expense(10), user_id)
+    assert forecast_batch.run(1, 100, ForecastGranularity.MONTHLY, 6) == 1
+
+    computed = []
+    compute = forecast_crud.compute_forecasts
+    monkeypatch.setattr(forecast_crud, "compute_forecasts", lambda *args: computed.append(args) or compute(*args))
+
+    with Session(engine) as db:
+        snapshot = get_forecast(db, user_id, ForecastGranularity.MONTHLY, 3)
+    assert computed == []
+    assert snapshot["horizon"] == 3 and len(snapshot["periods"]) == 3
+    assert snapshot["periods"][0]["expenses_cents"] >= 1000
+
+    with Session(engine) as db:
+        create_transaction(db, expense(5), user_id)
+    with Session(engine) as db:
+        fresh = get_forecast(db, user_id, ForecastGranularity.MONTHLY, 3)
+    assert len(computed) == 1
+    assert fresh["by_category"][0]["current_period_to_date_cents"] == 1500
+
+def test_forecast_ignores_a_snapshot_with_a_shorter_horizon(engine, make_user):
+    user_id, _ = make_user("horizon@test.local")
+    forecast_batch.run(1, 100, ForecastGranularity.MONTHLY, 2)
+    with Session(engine) as db:
+        assert len(get_forecast(db, user_id, ForecastGranularity.MONTHLY, 4)["periods"]) == 4
+
+def test_numpy_is_not_imported_at_startup():
+    code = "import sys, app.main; sys.exit('numpy' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core import database
+from app.core.config import settings
+from app.core.sqlite import SQLiteWriteQueue
+
+def test_pragmas_are_applied_on_every_connection(engine):
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == settings.SQLITE_BUSY_TIMEOUT_MS
+        assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -settings.SQLITE_CACHE_SIZE_KB
+
+def test_write_queue_admits_one_writer_at_a_time(tmp_path):
+    first = SQLiteWriteQueue(None, timeout=0.05)
+    assert first.acquire()
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(first.acquire()))
+    waiter.start()
+    waiter.join()
+    assert results == [False]
+    first.release()
+    assert first.acquire()
+    first.release()
+
+def test_write_queue_lock_file_is_shared_between_workers(tmp_path):
+    lock_path = str(tmp_path / "writer.lock")
+    worker_a, worker_b = SQLiteWriteQueue(lock_path, 0.05), SQLiteWriteQueue(lock_path, 0.05)
+    assert worker_a.acquire()
+    assert not worker_b.acquire()
+    worker_a.release()
+    assert worker_b.acquire()
+    worker_b.release()
+
+def run_writers(tmp_path, monkeypatch, write_queue: bool, threads: int = 8, writes: int = 5) -> int:
+    """Écrivains concurrents gardant leur transaction ouverte plus longtemps que busy_timeout"""
+    monkeypatch.setattr(settings, "SQLITE_BUSY_TIMEOUT_MS", 20)
+    monkeypatch.setattr(settings, "SQLITE_WRITE_QUEUE", write_queue)
+    engine = database.create_sqlite_engine(f"sqlite:///{tmp_path}/writers-{write_queue}.db")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE entry (writer INTEGER, n INTEGER)"))
+    locked = []
+
+    def writer(index: int):
+        for n in range(writes):
+            try:
+                with engine.begin() as conn:
+                    conn.execute(text("INSERT INTO entry VALUES (:w, :n)"), {"w": index, "n": n})
+                    time.sleep(0.03)  # travail applicatif dans la transaction
+            except OperationalError as exc:
+                assert "database is locked" in str(exc)
+                locked.append(exc)
+
+    workers = [threading.Thread(target=writer, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM entry")).scalar() == threads * writes - len(locked)
+    engine.dispose()
+    return len(locked)
+
+def test_write_queue_prevents_lock_errors_under_short_busy_timeout(tmp_path, monkeypatch):
+    # La file a son propre délai : busy_timeout court ne la fait pas abandonner
+    assert run_writers(tmp_path, monkeypatch, write_queue=True) == 0
+    assert run_writers(tmp_path, monkeypatch, write_queue=False) > 0
@@ -0,0 +1,78 @@
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.config import settings
+
+URL = "/api/v1/transactions/"
+
+@pytest.fixture
+def seeded(client, make_user):
+    """Un utilisateur avec quelques transactions à des dates distinctes"""
+    _, headers = make_user("list@test.local")
+    today = date.today()
+    for i, (amount, category) in enumerate(((19.99, "courses"), (0.1, "transport"), (1234.5, "loyer"))):
+        assert client.post(URL, json={
+            "amount": amount, "type": "expense", "category": category,
+            "date": (today - timedelta(days=i)).isoformat()
+        }, headers=headers).status_code == 200
+    return headers
+
+def test_default_list_returns_full_objects(client, seeded):
+    rows = client.get(URL, headers=seeded).json()
+    assert len(rows) == 3
+    assert {"transaction_id", "user_id", "amount", "currency", "created_at"} <= set(rows[0])
+
+def test_fields_projects_only_requested_keys(client, seeded):
+    rows = client.get(URL, params={"fields": "amount,category,date"}, headers=seeded).json()
+    assert [set(row) for row in rows] == [{"amount", "category", "date"}] * 3
+    assert sorted(row["amount"] for row in rows) == [0.1, 19.99, 1234.5]
+    assert all(date.fromisoformat(row["date"]) for row in rows)
+
+def test_columnar_format_returns_one_array_per_field(client, seeded):
+    body = client.get(URL, params={"fields": "category,amount", "format": "columnar"}, headers=seeded).json()
+    assert body["count"] == 3
+    assert body["fields"] == ["category", "amount"]
+    assert set(body["data"]) == {"category", "amount"}
+    pairs = dict(zip(body["data"]["category"], body["data"]["amount"]))
+    assert pairs == {"courses": 19.99, "transport": 0.1, "loyer": 1234.5}
+
+def test_columnar_without_fields_returns_every_field(client, seeded):
+    body = client.get(URL, params={"format": "columnar"}, headers=seeded).json()
+    assert len(body["fields"]) == len(body["data"]) and "transaction_id" in body["fields"]
+    assert all(len(values) == 3 for values in body["data"].values())
+
+def test_unknown_field_is_rejected(client, seeded):
+    response = client.get(URL, params={"fields": "amount,password"}, headers=seeded)
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+    assert client.get(URL, params={"fields": " , "}, headers=seeded).status_code == 400
+    assert client.get(URL, params={"format": "csv"}, headers=seeded).status_code == 422
+
+def test_empty_projection_keeps_its_shape(client, make_user):
+    _, headers = make_user("empty@test.local")
+    assert client.get(URL, params={"fields": "amount"}, headers=headers).json() == []
+    body = client.get(URL, params={"fields": "amount,date", "format": "columnar"}, headers=headers).json()
+    assert body == {"count": 0, "fields": ["amount", "date"], "data": {"amount": [], "date": []}}
+
+def test_large_pages_are_compressed_and_small_ones_are_not(client, make_user):
+    _, headers = make_user("big@test.local")
+    for i in range(30):
+        client.post(URL, json={"amount": i + 1, "type": "income", "category": "salaire"}, headers=headers)
+    headers = {**headers, "Accept-Encoding": "gzip"}
+
+    large = client.get(URL, headers=headers)
+    assert len(large.content) >= settings.COMPRESSION_MIN_SIZE
+    assert large.headers["content-encoding"] == "gzip"
+    assert len(large.json()) == 30
+
+    small = client.get(URL, params={"fields": "amount", "limit": 1}, headers=headers)
+    assert "content-encoding" not in small.headers
+
+def test_openapi_documents_alternate_shapes(client):
+    operation = client.get("/openapi.json").json()["paths"][URL]["get"]
+    schema = operation["responses"]["200"]["content"]["application/json"]["schema"]
+    refs = {variant.get("$ref") or variant["items"].get("$ref") for variant in schema["anyOf"]}
+    assert "#/components/schemas/TransactionResponse" in refs
+    assert "#/components/schemas/TransactionColumnarResponse" in refs
+    assert "400" in operation["responses"]